@@ -9,6 +9,8 @@ class PokerVisualization {
         this.currentTournament = '1';
         this.totalHands = 0;
         this.lastSummary = null;
+        this.pendingTable = null;
+        this.tableFrame = 0;
         this.init();
     }
 
@@ -26,13 +28,22 @@ class PokerVisualization {
             console.log('✅ Connected to WebSocket server');
             this.updateConnectionStatus(true);
             this.addLogEntry('Connected to game server. Waiting for game to start...', 'info');
-            this.ws.send(JSON.stringify({type: 'get_state'}));
+            // No get_state request: the server pushes the latest state and history on connect
         };
 
         this.ws.onmessage = (event) => {
             try {
-                const message = JSON.parse(event.data);
-                this.handleMessage(message);
+                const parsed = JSON.parse(event.data);
+                // Broadcasts sent close together arrive batched as an array
+                const messages = Array.isArray(parsed) ? parsed : [parsed];
+                for (const message of messages) {
+                    if (message.type === 'ping') {
+                        // Server heartbeat - answer so the connection isn't reaped
+                        this.ws.send(JSON.stringify({type: 'pong'}));
+                        continue;
+                    }
+                    this.handleMessage(message);
+                }
             } catch (error) {
                 console.error('Error parsing WebSocket message:', error, event.data);
             }
@@ -78,6 +89,9 @@ class PokerVisualization {
                         console.log('ℹ️ Game state has no community cards (normal for preflop)');
                     }
                     break;
+                case 'turn_change':
+                    this.handleTurnChange(message.data);
+                    break;
                 case 'hand_start':
                     this.handleHandStart(message.data);
                     break;
@@ -301,14 +315,79 @@ class PokerVisualization {
         return card;
     }
 
+    createSeat(index) {
+        // Build a seat's elements once; later updates only change their text and classes
+        const root = document.createElement('div');
+        root.className = `player-seat position-${index}`;
+
+        const header = document.createElement('div');
+        header.className = 'player-header-seat';
+        const name = document.createElement('span');
+        name.className = 'player-name-seat';
+        const type = document.createElement('span');
+        type.className = 'player-type-seat';
+        header.append(name, type);
+
+        const chips = document.createElement('div');
+        chips.className = 'player-chips-seat';
+        const bet = document.createElement('div');
+        bet.className = 'player-bet-seat';
+        const cards = document.createElement('div');
+        cards.className = 'player-cards-seat';
+
+        root.append(header, chips, bet, cards);
+        return { root, name, type, chips, bet, cards, cardsKey: null };
+    }
+
+    renderSeatCards(seat, cards) {
+        // Re-create card elements only when the hand shown in this seat changed
+        const hasCards = Array.isArray(cards) && cards.length > 0;
+        const cardsKey = hasCards ? cards.join('|') : '';
+        if (seat.cardsKey === cardsKey) return;
+        seat.cardsKey = cardsKey;
+
+        const hidden = () => {
+            const card = document.createElement('div');
+            card.className = 'card';
+            card.textContent = '🂠';
+            card.style.opacity = '0.3';
+            return card;
+        };
+        const elements = hasCards ? cards.map(card => {
+            try {
+                return this.createCardElement(card);
+            } catch (e) {
+                console.error('Error creating card element:', e, card);
+                return hidden();
+            }
+        }) : [hidden(), hidden()];
+        seat.cards.replaceChildren(...elements);
+    }
+
     updatePlayersOnTable(players, currentPlayerIndex) {
+        // Keep only the latest table; it is drawn at the next frame while the tab is visible
+        this.players = players;
+        this.pendingTable = { players, currentPlayerIndex };
+        this.scheduleTableRender();
+    }
+
+    scheduleTableRender() {
+        if (this.tableFrame || !this.pendingTable || document.visibilityState === 'hidden') return;
+        this.tableFrame = requestAnimationFrame(() => {
+            this.tableFrame = 0;
+            const pending = this.pendingTable;
+            this.pendingTable = null;
+            if (pending) this.renderPlayersOnTable(pending.players, pending.currentPlayerIndex);
+        });
+    }
+
+    renderPlayersOnTable(players, currentPlayerIndex) {
         const container = document.getElementById('players-container');
         if (!container) return;
 
         console.log('Updating players on table:', players, 'current:', currentPlayerIndex);
         
-        container.innerHTML = '';
-        this.players = players;
+        if (!this.seats) this.seats = [];
 
         const typeLabels = {
             'tagbot': 'TAGBot',
@@ -320,51 +399,47 @@ class PokerVisualization {
             'openai': 'OpenAI',
             'unknown': 'Unknown'
         };
+        const setText = (el, text) => {
+            if (el.textContent !== text) el.textContent = text;
+        };
 
         players.forEach((player, index) => {
-            const seat = document.createElement('div');
-            seat.className = 'player-seat';
-            seat.classList.add(`position-${index}`);
-            
-            if (index === currentPlayerIndex && currentPlayerIndex >= 0) {
-                seat.classList.add('active', 'current-turn');
-            } else {
-                seat.classList.remove('current-turn');
-            }
-            if (player.is_active === false) {
-                seat.classList.add('folded');
-            } else {
-                seat.classList.remove('folded');
+            // Seats are keyed by position and reused across updates
+            let seat = this.seats[index];
+            if (!seat) {
+                seat = this.seats[index] = this.createSeat(index);
+                container.appendChild(seat.root);
             }
 
+            const isCurrent = index === currentPlayerIndex && currentPlayerIndex >= 0;
+            seat.root.classList.toggle('active', isCurrent);
+            seat.root.classList.toggle('current-turn', isCurrent);
+            seat.root.classList.toggle('folded', player.is_active === false);
+
             const agentName = player.name || `Player ${index + 1}`;
             const agentType = (player.type || 'unknown').toLowerCase();
             const typeLabel = typeLabels[agentType] || agentType;
 
-            seat.innerHTML = `
-                <div class="player-header-seat">
-                    <span class="player-name-seat">${agentName}</span>
-                    <span class="player-type-seat">${typeLabel}</span>
-                </div>
-                <div class="player-chips-seat">💰${player.chips || 0}</div>
-                <div class="player-bet-seat">Bet: 💰${player.current_bet || 0}</div>
-                <div class="player-cards-seat">
-                    ${player.cards && Array.isArray(player.cards) && player.cards.length > 0 ? 
-                        player.cards.map(card => {
-                            try {
-                                return this.createCardElement(card).outerHTML;
-                            } catch (e) {
-                                console.error('Error creating card element:', e, card);
-                                return '<div class="card" style="opacity: 0.3;">🂠</div>';
-                            }
-                        }).filter(html => html).join('') : 
-                        '<div class="card" style="opacity: 0.3;">🂠</div><div class="card" style="opacity: 0.3;">🂠</div>'
-                    }
-                </div>
-            `;
-
-            container.appendChild(seat);
+            setText(seat.name, agentName);
+            setText(seat.type, typeLabel);
+            setText(seat.chips, `💰${player.chips || 0}`);
+            setText(seat.bet, `Bet: 💰${player.current_bet || 0}`);
+            this.renderSeatCards(seat, player.cards);
         });
+
+        // Drop seats of players no longer at the table
+        while (this.seats.length > players.length) {
+            this.seats.pop().root.remove();
+        }
+    }
+
+    handleTurnChange(data) {
+        // Table state is unchanged since the last game_state; only move the turn marker
+        if (data.current_player === undefined || !this.players) return;
+        if (this.gameState) {
+            this.gameState.current_player = data.current_player;
+        }
+        this.updatePlayersOnTable(this.players, data.current_player);
     }
 
     handleHandStart(data) {
@@ -494,6 +569,11 @@ class PokerVisualization {
     setupEventListeners() {
         // Load and display selected agents
         this.loadSelectedAgents();
+
+        // Table updates received while the tab was hidden are drawn once it is shown again
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'visible') this.scheduleTableRender();
+        });
     }
     
     loadSelectedAgents() {
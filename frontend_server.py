@@ -3,86 +3,177 @@
 Frontend server with WebSocket support for real-time game visualization
 """
 import asyncio
+import gzip
+import hashlib
 import json
 import time
+from typing import Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from pydantic import BaseModel
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from starlette.applications import Starlette
-from starlette.middleware import Middleware
-from starlette.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 import uvicorn
 from pathlib import Path
 
+# orjson is optional (faster encoding for WebSocket fan-out and API responses);
+# fall back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Return already-encoded JSON without re-serializing it"""
+    return Response(body, media_type="application/json")
+
 # Global WebSocket manager
 class ConnectionManager:
+    # Frames buffered per client before it is treated as a slow consumer and dropped
+    MAX_PENDING_MESSAGES = 64
+    # Seconds to collect broadcasts before sending them to clients as one frame
+    BROADCAST_TICK = 0.02
+
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
         self.game_state_history = []
+        # Encoded game_state_history for /api/history; reset whenever a state is added
+        self._history_body: Optional[bytes] = None
+        self._outboxes: dict[WebSocket, asyncio.Queue] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
+        self._pending_messages: list[dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        outbox = self._outboxes[websocket] = asyncio.Queue(maxsize=self.MAX_PENDING_MESSAGES)
+        self._writers[websocket] = asyncio.create_task(self._write_loop(websocket, outbox))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._outboxes.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _write_loop(self, websocket: WebSocket, outbox: asyncio.Queue):
+        """Drain one client's outbox so a slow socket only delays itself"""
+        try:
+            while True:
+                payload = await outbox.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket)
 
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
+        # Messages arriving within one tick go out together as a JSON array
+        self._pending_messages.append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(self.BROADCAST_TICK))
+
+    async def _flush_after(self, delay: float):
+        """Send everything broadcast during the last tick as a single frame"""
+        await asyncio.sleep(delay)
+        batch = self._pending_messages
+        self._pending_messages = []
+        self._flush_task = None
+        
+        # Encode once and queue the same text frame for every client's writer
+        payload = _json_dumps(batch[0] if len(batch) == 1 else batch)
+        slow = []
+        for connection, outbox in self._outboxes.items():
             try:
-                await connection.send_json(message)
-            except:
-                disconnected.append(connection)
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                slow.append(connection)
         
-        # Clean up disconnected clients
-        for conn in disconnected:
+        # Drop clients that fell too far behind; they reconnect and resync from history
+        for conn in slow:
             self.disconnect(conn)
+        if slow:
+            await asyncio.gather(*(conn.close(code=1013) for conn in slow), return_exceptions=True)
 
     def add_game_state(self, state: dict):
         """Add game state to history"""
+        self._history_body = None
         self.game_state_history.append(state)
         # Keep only last 100 states
         if len(self.game_state_history) > 100:
             self.game_state_history.pop(0)
 
+    def history_body(self) -> bytes:
+        """game_state_history as JSON, encoded at most once per change"""
+        if self._history_body is None:
+            self._history_body = _json_dumps(self.game_state_history).encode()
+        return self._history_body
+
 # Global connection manager
 manager = ConnectionManager()
 
 # Create FastAPI app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse)
+
+# No CORS middleware: the dashboard pages are served from this app (same origin)
+# and the green agent posts to /api/broadcast server-side
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers reuse assets for a few minutes before revalidating"""
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        response.headers.setdefault("Cache-Control", "public, max-age=300")
+        return response
 
 # Mount static files (CSS, JS)
 frontend_dir = Path(__file__).parent / "frontend"
-app.mount("/static", StaticFiles(directory=str(frontend_dir)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(frontend_dir)), name="static")
+
+# path -> (mtime_ns, ETag, raw bytes, gzip-compressed bytes) for the HTML pages
+_page_cache: dict[Path, tuple[int, str, bytes, bytes]] = {}
+
+def _page_response(path: Path, request: Request) -> Response:
+    """Serve an HTML page from memory, gzip-compressed when the client accepts it"""
+    mtime = path.stat().st_mtime_ns
+    cached = _page_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        # Re-read only when the file changed on disk
+        body = path.read_bytes()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        cached = _page_cache[path] = (mtime, etag, body, gzip.compress(body, 6))
+    _, etag, body, body_gz = cached
+    # Pages always revalidate (they name the assets); an unchanged page costs a 304
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(body_gz, media_type="text/html", headers=headers)
+    return Response(body, media_type="text/html", headers=headers)
 
 @app.get("/")
-async def read_root():
+async def read_root(request: Request):
     """Serve the frontend HTML"""
     frontend_path = frontend_dir / "index.html"
     if not frontend_path.exists():
         return {"error": "Frontend not found", "path": str(frontend_path)}
-    return FileResponse(frontend_path)
+    return _page_response(frontend_path, request)
 
 @app.get("/select")
-async def select_agents_page():
+async def select_agents_page(request: Request):
     """Serve the agent selection page"""
     selection_path = frontend_dir / "agent-selection.html"
     if not selection_path.exists():
         return {"error": "Selection page not found"}
-    return FileResponse(selection_path)
+    return _page_response(selection_path, request)
 
 @app.get("/style.css")
 async def get_style():
@@ -100,6 +191,10 @@ async def get_script():
         return FileResponse(js_path, media_type="application/javascript")
     return {"error": "JS not found"}
 
+# Seconds of client silence before a ping, and how long the client has to answer it
+HEARTBEAT_INTERVAL = 30
+PONG_TIMEOUT = 10
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
@@ -124,14 +219,33 @@ async def websocket_endpoint(websocket: WebSocket):
                 "data": {"message": "Connected. Waiting for game to start..."}
             })
         
-        # Keep connection alive
+        # Keep connection alive; a silent client is pinged, and closed if it
+        # still hasn't sent anything PONG_TIMEOUT seconds later
+        awaiting_pong = False
         while True:
             try:
-                data = await websocket.receive_text()
+                data = await asyncio.wait_for(
+                    websocket.receive_text(),
+                    timeout=PONG_TIMEOUT if awaiting_pong else HEARTBEAT_INTERVAL,
+                )
+            except asyncio.TimeoutError:
+                if awaiting_pong:
+                    manager.disconnect(websocket)
+                    await websocket.close(code=1001)
+                    break
+                awaiting_pong = True
+                await websocket.send_json({"type": "ping"})
+                continue
+            awaiting_pong = False
+            
+            try:
                 message = json.loads(data)
                 
                 # Handle client requests
-                if message.get("type") == "get_state":
+                if message.get("type") == "pong":
+                    # Heartbeat reply; receiving it is all that matters
+                    continue
+                elif message.get("type") == "get_state":
                     # Send current state if available
                     if manager.game_state_history:
                         last_state = manager.game_state_history[-1]
@@ -163,41 +277,51 @@ async def get_current_state():
 @app.get("/api/history")
 async def get_history():
     """Get game state history"""
-    return manager.game_state_history
+    return _json_bytes_response(manager.history_body())
 
 # Store selected agents (shared state)
 selected_agents_for_tournament = []
 
+# The agent list never changes, so it is encoded once at import
+_AVAILABLE_AGENTS_BODY = _json_dumps({
+    "agents": [
+        {"id": "tagbot", "name": "TAGBot", "description": "Tight-Aggressive"},
+        {"id": "montecarlo", "name": "Monte Carlo", "description": "Simulation-Based"},
+        {"id": "maniac", "name": "Maniac", "description": "Ultra-Aggressive"},
+        {"id": "smart_agent", "name": "Smart Agent", "description": "Pot Odds & Position"},
+        {"id": "equity", "name": "Equity Calculator", "description": "Equity-Based"},
+        {"id": "adaptive", "name": "Adaptive Heuristic", "description": "Stack-Aware Adaptive"}
+    ]
+}).encode()
+
+# Encoded /api/selected-agents response; reset to None whenever the selection changes
+_selected_agents_body = None
+
 @app.get("/api/available-agents")
 async def get_available_agents():
     """Get list of all available agents"""
-    return {
-        "agents": [
-            {"id": "tagbot", "name": "TAGBot", "description": "Tight-Aggressive"},
-            {"id": "montecarlo", "name": "Monte Carlo", "description": "Simulation-Based"},
-            {"id": "maniac", "name": "Maniac", "description": "Ultra-Aggressive"},
-            {"id": "smart_agent", "name": "Smart Agent", "description": "Pot Odds & Position"},
-            {"id": "equity", "name": "Equity Calculator", "description": "Equity-Based"},
-            {"id": "adaptive", "name": "Adaptive Heuristic", "description": "Stack-Aware Adaptive"}
-        ]
-    }
+    return _json_bytes_response(_AVAILABLE_AGENTS_BODY)
 
 @app.get("/api/selected-agents")
 async def get_selected_agents():
     """Get currently selected agents"""
-    global selected_agents_for_tournament
-    if not selected_agents_for_tournament:
-        # Return default if none selected (5 agents)
-        return {
-            "agents": [
-                {"id": "tagbot", "name": "TAGBot", "description": "Tight-Aggressive"},
-                {"id": "montecarlo", "name": "Monte Carlo", "description": "Simulation-Based"},
-                {"id": "maniac", "name": "Maniac", "description": "Ultra-Aggressive"},
-                {"id": "smart_agent", "name": "Smart Agent", "description": "Pot Odds & Position"},
-                {"id": "adaptive", "name": "Adaptive Heuristic", "description": "Stack-Aware Adaptive"}
-            ]
-        }
-    return {"agents": selected_agents_for_tournament}
+    global _selected_agents_body
+    if _selected_agents_body is None:
+        if not selected_agents_for_tournament:
+            # Return default if none selected (5 agents)
+            selected = {
+                "agents": [
+                    {"id": "tagbot", "name": "TAGBot", "description": "Tight-Aggressive"},
+                    {"id": "montecarlo", "name": "Monte Carlo", "description": "Simulation-Based"},
+                    {"id": "maniac", "name": "Maniac", "description": "Ultra-Aggressive"},
+                    {"id": "smart_agent", "name": "Smart Agent", "description": "Pot Odds & Position"},
+                    {"id": "adaptive", "name": "Adaptive Heuristic", "description": "Stack-Aware Adaptive"}
+                ]
+            }
+        else:
+            selected = {"agents": selected_agents_for_tournament}
+        _selected_agents_body = _json_dumps(selected).encode()
+    return _json_bytes_response(_selected_agents_body)
 
 class AgentSelection(BaseModel):
     agents: list
@@ -205,7 +329,7 @@ class AgentSelection(BaseModel):
 @app.post("/api/select-agents")
 async def select_agents(selection: AgentSelection):
     """Receive selected agents and store for tournament"""
-    global selected_agents_for_tournament
+    global selected_agents_for_tournament, _selected_agents_body
     selected = selection.agents
     if len(selected) != 5:
         return {"success": False, "error": "Must select exactly 5 agents"}
@@ -221,6 +345,7 @@ async def select_agents(selection: AgentSelection):
     }
     
     selected_agents_for_tournament = [all_agents[aid] for aid in selected if aid in all_agents]
+    _selected_agents_body = None
     
     # Write to config file for assessment manager to read
     import toml
@@ -239,15 +364,18 @@ async def select_agents(selection: AgentSelection):
     
     return {"success": True, "message": "Agents selected", "agents": selected_agents_for_tournament}
 
+class BroadcastUpdate(BaseModel):
+    type: str
+    data: dict = {}
+
 @app.post("/api/broadcast")
-async def receive_broadcast(update: dict):
+async def receive_broadcast(update: BroadcastUpdate):
     """Receive broadcast from assessment manager and forward to WebSocket clients"""
-    update_type = update.get("type")
-    data = update.get("data", {})
+    update_type = update.type
     
     message = {
         "type": update_type,
-        "data": data,
+        "data": update.data,
         "timestamp": time.time()
     }
     manager.add_game_state(message)
@@ -10,6 +10,17 @@ import argparse
 from pathlib import Path
 import os
 import dotenv
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# uvloop is optional (libuv-based event loop); asyncio's default loop is used without it
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Load environment variables
 dotenv.load_dotenv()
@@ -48,9 +59,8 @@ async def start_green_agent_only(agent_name: str = None, host: str = None, port:
         # Load configuration to get defaults
         config_path = "src/green_agent/agent_card.toml"
         try:
-            import toml
-            with open(config_path, 'r') as f:
-                config = toml.load(f)
+            with open(config_path, 'rb') as f:
+                config = tomllib.load(f)
         except Exception as e:
             print(f"❌ Error loading config from {config_path}: {e}")
             return
@@ -103,17 +113,27 @@ def start_white_agent_only(agent_id: str, port: int, agent_type: str = "openai")
 
 
 
+async def _stop_process(process: asyncio.subprocess.Process, timeout: float = 5.0):
+    """Terminate a child process and await its exit, killing it if it does not stop in time"""
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+        await asyncio.wait_for(process.wait(), timeout)
+    except ProcessLookupError:
+        pass  # Already exited
+    except Exception:
+        process.kill()
+        await process.wait()
+
+
 async def start_full_system(agent_name: str = None, host: str = None, port: int = None):
     """Start the complete evaluation system (green agent A2A server + evaluation)"""
-    import subprocess
-    import time
-    
     # Load configuration to get white agents
     config_path = "src/green_agent/agent_card.toml"
     try:
-        import toml
-        with open(config_path, 'r') as f:
-            config = toml.load(f)
+        with open(config_path, 'rb') as f:
+            config = tomllib.load(f)
     except Exception as e:
         print(f"❌ Error loading config from {config_path}: {e}")
         return
@@ -122,11 +142,11 @@ async def start_full_system(agent_name: str = None, host: str = None, port: int
     frontend_process = None
     try:
         print("🌐 Starting frontend server...")
-        frontend_process = subprocess.Popen([
+        frontend_process = await asyncio.create_subprocess_exec(
             sys.executable, "frontend_server.py"
-        ])
+        )
         print("✅ Frontend server started on http://localhost:8080")
-        time.sleep(1)  # Give frontend server time to start
+        await asyncio.sleep(1)  # Give frontend server time to start
     except Exception as e:
         print(f"⚠️  Could not start frontend server: {e}")
         print("   You can start it manually: python frontend_server.py")
@@ -154,17 +174,17 @@ async def start_full_system(agent_name: str = None, host: str = None, port: int
             print(f"⚪ Starting {agent_data['name']} (type: {agent_type}) on port {port}")
             
             # Start white agent in background process
-            process = subprocess.Popen([
+            process = await asyncio.create_subprocess_exec(
                 sys.executable, "launcher.py", 
                 "--white-only", 
                 "--agent-id", agent_id, 
                 "--port", str(port),
                 "--agent-type", agent_type
-            ])
+            )
             white_agent_processes.append(process)
             
             # Wait a bit between starting agents
-            time.sleep(2)
+            await asyncio.sleep(2)
         
         print("✅ All white agents started")
         print("🔄 Starting green agent and evaluation...")
@@ -188,20 +208,12 @@ async def start_full_system(agent_name: str = None, host: str = None, port: int
         # Clean up white agent processes
         print("🧹 Cleaning up white agent processes...")
         for process in white_agent_processes:
-            try:
-                process.terminate()
-                process.wait(timeout=5)
-            except:
-                process.kill()
+            await _stop_process(process)
         
         # Clean up frontend server
         if frontend_process:
-            try:
-                print("🧹 Cleaning up frontend server...")
-                frontend_process.terminate()
-                frontend_process.wait(timeout=5)
-            except:
-                frontend_process.kill()
+            print("🧹 Cleaning up frontend server...")
+            await _stop_process(frontend_process)
 
 
 def run_from_env():
@@ -293,10 +305,14 @@ Examples:
     args = parser.parse_args()
     
     # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # Prebuilt root handler; no %(asctime)s so records skip the strftime call
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(name)s - %(levelname)s - %(message)s'))
+    logging.root.addHandler(handler)
+    logging.root.setLevel(logging.INFO)
+    
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     
     try:
         # Handle 'run' command (similar to tau_bench)
@@ -3,9 +3,15 @@ Poker Game Engine - Handles game logic, hand evaluation, and game state manageme
 """
 import random
 from enum import Enum
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Sequence, Tuple, Any
 from dataclasses import dataclass
 from collections import Counter
+from itertools import combinations, combinations_with_replacement
+from math import prod
+from operator import attrgetter
+
+
+_chips_of = attrgetter("chips")
 
 
 class Suit(Enum):
@@ -52,17 +58,32 @@ class Action(Enum):
     ALL_IN = "all_in"
 
 
+# Each rank maps to a prime (indexed by rank value) for the hand lookup tables below
+_RANK_PRIMES = (0, 0, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
 @dataclass
 class Card:
+    # Compact instances; "prime" is the rank's prime for the hand lookup tables, resolved
+    # once so evaluation skips the Enum access (derived, so not a dataclass field)
+    __slots__ = ("rank", "suit", "prime")
+    
     rank: Rank
     suit: Suit
     
+    def __post_init__(self):
+        self.prime = _RANK_PRIMES[self.rank.value]
+    
     def __str__(self):
         rank_str = {11: 'J', 12: 'Q', 13: 'K', 14: 'A'}.get(self.rank.value, str(self.rank.value))
         suit_symbol = {'hearts': '♥', 'diamonds': '♦', 'clubs': '♣', 'spades': '♠'}
         return f"{rank_str}{suit_symbol[self.suit.value]}"
 
 
+# The 52 cards, built once: hands shuffle a copy of this instead of re-creating Card objects
+_FULL_DECK = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
 @dataclass
 class Player:
     id: str
@@ -97,6 +118,83 @@ class GameState:
     minimum_raise: int = 0  # Minimum raise amount (previous raise delta)
 
 
+# Rank bitmask of the wheel A-2-3-4-5 (the ace plays low)
+_WHEEL_MASK = (1 << 14) | 0x3C
+
+# Five-card lookup tables (Cactus Kev style): the product of a hand's five rank primes
+# identifies its rank multiset regardless of card order.
+def _is_straight(ranks: List[int]) -> bool:
+    """Check if five ranks form a straight"""
+    rank_mask = 0
+    for rank in ranks:
+        rank_mask |= 1 << rank
+    # Bit r survives only when ranks r..r+4 are all present (SWAR run detection)
+    if rank_mask & (rank_mask >> 1) & (rank_mask >> 2) & (rank_mask >> 3) & (rank_mask >> 4):
+        return True
+    
+    # Check for A-2-3-4-5 straight
+    return rank_mask == _WHEEL_MASK
+
+
+def _classify_five(ranks: List[int], is_flush: bool) -> Tuple[HandRank, List[int]]:
+    """Evaluate five ranks (and whether they share a suit) into (rank, tiebreaker_values)"""
+    rank_counts = Counter(ranks)
+    
+    # Sort ranks by frequency then by value
+    sorted_ranks = sorted(rank_counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
+    values = [rank for rank, count in sorted_ranks]
+    counts = [count for rank, count in sorted_ranks]
+    
+    is_straight = _is_straight(ranks)
+    
+    if is_straight and is_flush:
+        if min(ranks) == 10:  # 10, J, Q, K, A
+            return HandRank.ROYAL_FLUSH, []
+        else:
+            return HandRank.STRAIGHT_FLUSH, [max(ranks)]
+    elif counts == [4, 1]:
+        return HandRank.FOUR_OF_A_KIND, values
+    elif counts == [3, 2]:
+        return HandRank.FULL_HOUSE, values
+    elif is_flush:
+        return HandRank.FLUSH, sorted(ranks, reverse=True)
+    elif is_straight:
+        return HandRank.STRAIGHT, [max(ranks)]
+    elif counts == [3, 1, 1]:
+        return HandRank.THREE_OF_A_KIND, values
+    elif counts == [2, 2, 1]:
+        return HandRank.TWO_PAIR, values
+    elif counts == [2, 1, 1, 1]:
+        return HandRank.PAIR, values
+    else:
+        return HandRank.HIGH_CARD, sorted(ranks, reverse=True)
+
+
+def _build_hand_tables() -> Tuple[Dict[int, tuple], Dict[int, tuple]]:
+    """Evaluate every distinct five-card hand once, keyed by its rank prime product
+    
+    Entries are (hand_rank.value, tiebreaker, hand_rank) so they compare directly.
+    Only hands of five distinct ranks can be flushes, so the flush table is smaller.
+    """
+    rank_table = {}
+    flush_table = {}
+    for ranks in combinations_with_replacement(range(2, 15), 5):
+        if max(Counter(ranks).values()) > 4:
+            continue  # Only four cards of each rank exist
+        product = 1
+        for rank in ranks:
+            product *= _RANK_PRIMES[rank]
+        hand_rank, tiebreaker = _classify_five(list(ranks), False)
+        rank_table[product] = (hand_rank.value, tiebreaker, hand_rank)
+        if len(set(ranks)) == 5:
+            hand_rank, tiebreaker = _classify_five(list(ranks), True)
+            flush_table[product] = (hand_rank.value, tiebreaker, hand_rank)
+    return rank_table, flush_table
+
+
+_RANK_TABLE, _FLUSH_TABLE = _build_hand_tables()
+
+
 class PokerEngine:
     def __init__(self, small_blind: int = 10, big_blind: int = 20):
         self.small_blind = small_blind
@@ -104,16 +202,13 @@ class PokerEngine:
         self.game_state: Optional[GameState] = None
         self.dealer_position: int = 0  # Track dealer position across hands
         self.hand_number: int = 0  # Track hand number across games
+        self.last_winner_ids: List[str] = []  # Winner(s) of the main pot in the last completed hand
         
     def create_deck(self) -> List[Card]:
         """Create a standard 52-card deck"""
-        deck = []
-        for suit in Suit:
-            for rank in Rank:
-                deck.append(Card(rank, suit))
-        return deck
+        return list(_FULL_DECK)
     
-    def shuffle_deck(self, deck: List[Card]) -> List[Card]:
+    def shuffle_deck(self, deck: Sequence[Card]) -> List[Card]:
         """Shuffle the deck"""
         return random.sample(deck, len(deck))
     
@@ -128,6 +223,7 @@ class PokerEngine:
         """Start a new poker hand with rotating blinds"""
         # Increment hand number
         self.hand_number += 1
+        self.last_winner_ids = []
         
         # Create players (preserve chips if continuing a game, otherwise start fresh)
         players = []
@@ -156,8 +252,8 @@ class PokerEngine:
             # First hand: dealer starts at position 0
             self.dealer_position = 0
         
-        # Create and shuffle deck
-        deck = self.shuffle_deck(self.create_deck())
+        # Shuffle a fresh copy of the prebuilt deck
+        deck = self.shuffle_deck(_FULL_DECK)
         
         # Set up game state
         self.game_state = GameState(
@@ -234,75 +330,42 @@ class PokerEngine:
         if len(cards) < 5:
             return HandRank.HIGH_CARD, [max(card.rank.value for card in cards)]
         
-        # Get all possible 5-card combinations
-        from itertools import combinations
-        best_rank = HandRank.HIGH_CARD
-        best_tiebreaker = []
+        # Read each card once, then score every 5-card combination by table lookup
+        primes = [card.prime for card in cards]
+        suits = [card.suit for card in cards]
         
-        for combo in combinations(cards, 5):
-            rank, tiebreaker = self._evaluate_hand(list(combo))
-            if rank.value > best_rank.value or (rank.value == best_rank.value and tiebreaker > best_tiebreaker):
-                best_rank = rank
-                best_tiebreaker = tiebreaker
+        # Without five cards of one suit no combination is a flush, so every lookup
+        # goes to the rank table (the common case)
+        if not any(suits.count(suit) >= 5 for suit in set(suits)):
+            best = max(map(_RANK_TABLE.__getitem__, map(prod, combinations(primes, 5))))
+            return best[2], list(best[1])
+        
+        best = None
+        for a, b, c, d, e in combinations(range(len(cards)), 5):
+            product = primes[a] * primes[b] * primes[c] * primes[d] * primes[e]
+            suit = suits[a]
+            if suit is suits[b] and suit is suits[c] and suit is suits[d] and suit is suits[e]:
+                entry = _FLUSH_TABLE[product]
+            else:
+                entry = _RANK_TABLE[product]
+            if best is None or entry > best:
+                best = entry
         
-        return best_rank, best_tiebreaker
+        return best[2], list(best[1])
+    
+    def get_hand_ranks(self, hands: Sequence[List[Card]]) -> List[Tuple[HandRank, List[int]]]:
+        """Evaluate several hands in one call, in order (see get_hand_rank)"""
+        return list(map(self.get_hand_rank, hands))
     
     def _evaluate_hand(self, cards: List[Card]) -> Tuple[HandRank, List[int]]:
         """Evaluate a 5-card hand"""
-        ranks = [card.rank.value for card in cards]
-        suits = [card.suit for card in cards]
-        
-        rank_counts = Counter(ranks)
-        suit_counts = Counter(suits)
-        
-        # Sort ranks by frequency then by value
-        sorted_ranks = sorted(rank_counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
-        values = [rank for rank, count in sorted_ranks]
-        counts = [count for rank, count in sorted_ranks]
-        
-        is_flush = len(suit_counts) == 1
-        is_straight = self._is_straight(ranks)
-        
-        if is_straight and is_flush:
-            if min(ranks) == 10:  # 10, J, Q, K, A
-                return HandRank.ROYAL_FLUSH, []
-            else:
-                return HandRank.STRAIGHT_FLUSH, [max(ranks)]
-        elif counts == [4, 1]:
-            return HandRank.FOUR_OF_A_KIND, values
-        elif counts == [3, 2]:
-            return HandRank.FULL_HOUSE, values
-        elif is_flush:
-            return HandRank.FLUSH, sorted(ranks, reverse=True)
-        elif is_straight:
-            return HandRank.STRAIGHT, [max(ranks)]
-        elif counts == [3, 1, 1]:
-            return HandRank.THREE_OF_A_KIND, values
-        elif counts == [2, 2, 1]:
-            return HandRank.TWO_PAIR, values
-        elif counts == [2, 1, 1, 1]:
-            return HandRank.PAIR, values
-        else:
-            return HandRank.HIGH_CARD, sorted(ranks, reverse=True)
-    
-    def _is_straight(self, ranks: List[int]) -> bool:
-        """Check if ranks form a straight"""
-        sorted_ranks = sorted(set(ranks))
-        if len(sorted_ranks) != 5:
-            return False
-        
-        # Check for regular straight
-        for i in range(4):
-            if sorted_ranks[i+1] - sorted_ranks[i] != 1:
-                break
-        else:
-            return True
-        
-        # Check for A-2-3-4-5 straight
-        if sorted_ranks == [2, 3, 4, 5, 14]:
-            return True
-        
-        return False
+        product = 1
+        for card in cards:
+            product *= card.prime
+        suit = cards[0].suit
+        is_flush = all(card.suit is suit for card in cards)
+        _, tiebreaker, hand_rank = (_FLUSH_TABLE if is_flush else _RANK_TABLE)[product]
+        return hand_rank, list(tiebreaker)
     
     def process_action(self, player_id: str, action: Action, amount: int = 0) -> Dict[str, Any]:
         """Process a player's action with proper poker rules enforcement"""
@@ -653,12 +716,13 @@ class PokerEngine:
         
         # Store pot amount before distribution for verification
         pot_before = self.game_state.pot
-        total_chips_before = sum(p.chips for p in self.game_state.players)
+        total_chips_before = sum(map(_chips_of, self.game_state.players))
         
         if len(active_players) == 1:
             # Only one player left - they win everything
             winner = active_players[0]
             winner.chips += self.game_state.pot
+            self.last_winner_ids = [winner.id]
             self.game_state.pot = 0  # Reset pot after distribution
         else:
             # Check if we need side pots (players went all-in with different amounts)
@@ -675,7 +739,7 @@ class PokerEngine:
             self.game_state.pot = 0
         
         # VERIFICATION: Ensure all chips were correctly distributed
-        total_chips_after = sum(p.chips for p in self.game_state.players)
+        total_chips_after = sum(map(_chips_of, self.game_state.players))
         expected_total = total_chips_before + pot_before
         
         if total_chips_after != expected_total:
@@ -698,6 +762,7 @@ class PokerEngine:
         # Create side pots level by level
         previous_level = 0
         total_distributed = 0
+        main_pot_eligible = 0
         
         for level in all_in_amounts:
             # Calculate pot at this level
@@ -728,6 +793,10 @@ class PokerEngine:
                     winners[0].chips += remainder
                 
                 total_distributed += pot_at_level
+                # The pot contested by the most players is the main pot; its winners win the hand
+                if len(eligible_players) >= main_pot_eligible:
+                    main_pot_eligible = len(eligible_players)
+                    self.last_winner_ids = [w.id for w in winners]
                 print(f"   Side pot level {level}: {pot_at_level} chips distributed to {len(winners)} winner(s)")
             
             previous_level = level
@@ -753,6 +822,7 @@ class PokerEngine:
     def _distribute_simple_pot(self, active_players: List[Player]):
         """Distribute pot when no side pots are needed"""
         winners = self._evaluate_hands_for_pot(active_players)
+        self.last_winner_ids = [w.id for w in winners]
         
         pot_per_winner = self.game_state.pot // len(winners)
         remainder = self.game_state.pot % len(winners)
@@ -776,10 +846,10 @@ class PokerEngine:
         best_tiebreaker = []
         winners = []
         
-        for player in players:
-            all_cards = player.cards + self.game_state.community_cards
-            rank, tiebreaker = self.get_hand_rank(all_cards)
-            
+        community_cards = self.game_state.community_cards
+        hand_ranks = self.get_hand_ranks([player.cards + community_cards for player in players])
+        
+        for player, (rank, tiebreaker) in zip(players, hand_ranks):
             if rank.value > best_rank.value:
                 best_rank = rank
                 best_tiebreaker = tiebreaker
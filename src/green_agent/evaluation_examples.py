@@ -3,25 +3,31 @@
 Evaluation Examples Module
 Shows concrete examples of how the green agent evaluates outputs from different white agents
 """
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, Iterator, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from enum import IntEnum
 import json
+import operator
+import os
 
 
-class AssessmentDimension(Enum):
+class AssessmentDimension(IntEnum):
     """What the green agent is assessing"""
-    CORRECTNESS = "correctness"  # Is the action valid and legal?
-    STRATEGIC_QUALITY = "strategic_quality"  # Is the action strategically sound?
-    CONSISTENCY = "consistency"  # Is the agent consistent with its stated strategy?
-    RESPONSE_FORMAT = "response_format"  # Does the response follow the required format?
-    REASONING_QUALITY = "reasoning_quality"  # Is the reasoning logical and sound?
-    POSITION_AWARENESS = "position_awareness"  # Does the agent consider position?
-    POT_ODDS_AWARENESS = "pot_odds_awareness"  # Does the agent consider pot odds?
-    STACK_MANAGEMENT = "stack_management"  # Does the agent manage stack size appropriately?
+    CORRECTNESS = 0  # Is the action valid and legal?
+    STRATEGIC_QUALITY = 1  # Is the action strategically sound?
+    CONSISTENCY = 2  # Is the agent consistent with its stated strategy?
+    RESPONSE_FORMAT = 3  # Does the response follow the required format?
+    REASONING_QUALITY = 4  # Is the reasoning logical and sound?
+    POSITION_AWARENESS = 5  # Does the agent consider position?
+    POT_ODDS_AWARENESS = 6  # Does the agent consider pot odds?
+    STACK_MANAGEMENT = 7  # Does the agent manage stack size appropriately?
+    
+    def __str__(self) -> str:
+        """Semantic label used in JSON payloads"""
+        return self.name.lower()
 
 
-@dataclass
+@dataclass(frozen=True)
 class EvaluationExample:
     """A concrete example of evaluating a white agent's output"""
     scenario_description: str
@@ -29,18 +35,102 @@ class EvaluationExample:
     agent_response: Dict[str, Any]
     agent_type: str
     expected_action: str  # Ground truth or expected action
-    assessments: Dict[AssessmentDimension, Tuple[float, str]]  # Score (0-1) and explanation
-    overall_score: float
+    scores: Tuple[float, ...]  # Score (0-1) per dimension, indexed by AssessmentDimension
+    explanations: Tuple[str, ...]  # Explanation per dimension, parallel to scores
     benchmark_label: str  # For test cases with ground truth
+    overall_score: float = field(init=False)  # Derived from scores
+    
+    def __post_init__(self):
+        object.__setattr__(self, "overall_score", compute_overall_score(self.scores))
+    
+    @classmethod
+    def from_assessments(cls, assessments: Dict[AssessmentDimension, Tuple[float, str]], **fields: Any) -> "EvaluationExample":
+        """Build an example from a {dimension: (score, explanation)} mapping"""
+        return cls(
+            scores=tuple(assessments[dimension][0] for dimension in AssessmentDimension),
+            explanations=tuple(assessments[dimension][1] for dimension in AssessmentDimension),
+            **fields
+        )
+    
+    def assessment_items(self) -> Iterator[Tuple[AssessmentDimension, float, str]]:
+        """(dimension, score, explanation) for every dimension"""
+        return zip(AssessmentDimension, self.scores, self.explanations)
+
+
+# Relative weight of each dimension in the overall score, indexed by AssessmentDimension
+DIMENSION_WEIGHTS: Tuple[float, ...] = (1.0,) * len(AssessmentDimension)
+_WEIGHT_SUM = sum(DIMENSION_WEIGHTS)
+
+
+def compute_overall_score(scores: Tuple[float, ...]) -> float:
+    """Weighted mean of the per-dimension scores"""
+    return sum(map(operator.mul, DIMENSION_WEIGHTS, scores)) / _WEIGHT_SUM
+
+
+# Examples are constant data, so they are built on first use and reused
+_EXAMPLES_CACHE: Optional[Tuple[EvaluationExample, ...]] = None
+
+# Precomputed examples, regenerated with `python src/green_agent/evaluation_examples.py`
+# whenever the example_* methods below change
+FROZEN_EXAMPLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "evaluation_examples.json")
+
+
+def _example_to_dict(example: EvaluationExample) -> Dict[str, Any]:
+    """Plain-JSON form of an example (overall_score is derived, so it is not stored)"""
+    return {
+        "scenario_description": example.scenario_description,
+        "game_state": example.game_state,
+        "agent_response": example.agent_response,
+        "agent_type": example.agent_type,
+        "expected_action": example.expected_action,
+        "scores": list(example.scores),
+        "explanations": list(example.explanations),
+        "benchmark_label": example.benchmark_label,
+    }
+
+
+def _example_from_dict(data: Dict[str, Any]) -> EvaluationExample:
+    """Rebuild an example from its plain-JSON form"""
+    return EvaluationExample(**{
+        **data,
+        "scores": tuple(data["scores"]),
+        "explanations": tuple(data["explanations"]),
+    })
+
+
+def _load_frozen_examples() -> Optional[Tuple[EvaluationExample, ...]]:
+    """Load the precomputed examples, or None if the file is missing"""
+    try:
+        with open(FROZEN_EXAMPLES_PATH, "rb") as f:
+            raw = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    return tuple(_example_from_dict(item) for item in raw)
+
+
+def freeze_examples(path: str = FROZEN_EXAMPLES_PATH) -> None:
+    """Write the examples built by EvaluationExamples as compact JSON"""
+    examples = [_example_to_dict(example) for example in EvaluationExamples._build_examples()]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(examples, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
 
 
 class EvaluationExamples:
     """Collection of concrete evaluation examples"""
     
     @staticmethod
-    def get_examples() -> List[EvaluationExample]:
-        """Get all evaluation examples"""
-        return [
+    def get_examples() -> Tuple[EvaluationExample, ...]:
+        """Get all evaluation examples (built once, then shared)"""
+        global _EXAMPLES_CACHE
+        if _EXAMPLES_CACHE is None:
+            _EXAMPLES_CACHE = _load_frozen_examples() or EvaluationExamples._build_examples()
+        return _EXAMPLES_CACHE
+    
+    @staticmethod
+    def _build_examples() -> Tuple[EvaluationExample, ...]:
+        """Construct the fixed set of evaluation examples"""
+        return (
             EvaluationExamples.example_1_preflop_strong_hand(),
             EvaluationExamples.example_2_preflop_weak_hand(),
             EvaluationExamples.example_3_flop_strong_hand(),
@@ -49,7 +139,7 @@ class EvaluationExamples:
             EvaluationExamples.example_6_all_in_decision(),
             EvaluationExamples.example_7_position_awareness(),
             EvaluationExamples.example_8_pot_odds_calculation(),
-        ]
+        )
     
     @staticmethod
     def example_1_preflop_strong_hand() -> EvaluationExample:
@@ -89,7 +179,7 @@ class EvaluationExamples:
         }
         
         # Use TAGBot as example
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Preflop with pocket aces (A♠ A♥) on button, facing big blind",
             game_state=game_state,
             agent_response=tagbot_response,
@@ -105,7 +195,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.7, "Pot odds not explicitly calculated"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.9, "Bet size appropriate for stack (8% of stack)")
             },
-            overall_score=0.91,
             benchmark_label="preflop_strong_hand"
         )
     
@@ -139,7 +228,7 @@ class EvaluationExamples:
             "reasoning": "Any two cards can win! Let's go!"
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Preflop with 7-2 offsuit (worst hand) in early position",
             game_state=game_state,
             agent_response=smart_response,
@@ -155,7 +244,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.8, "Implicitly considered (folding bad hand)"),
                 AssessmentDimension.STACK_MANAGEMENT: (1.0, "Preserving chips by folding")
             },
-            overall_score=0.97,
             benchmark_label="preflop_weak_hand"
         )
     
@@ -182,7 +270,7 @@ class EvaluationExamples:
             "reasoning": "Top pair with top kicker. Estimated equity ~85%. Betting for value."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Flop with top pair (A♠ K♥ on A♦ 7♣ 2♠ board)",
             game_state=game_state,
             agent_response=equity_response,
@@ -198,7 +286,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.9, "Equity calculation shows pot odds awareness"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.85, "Bet size appropriate (~6% of stack)")
             },
-            overall_score=0.93,
             benchmark_label="flop_strong_hand"
         )
     
@@ -225,7 +312,7 @@ class EvaluationExamples:
             "reasoning": "Flush draw with 9 outs. Pot odds: 150:50 = 3:1. Need ~25% equity, have ~36%. Call is profitable."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Flop with flush draw (9♠ 8♠ on K♠ 7♠ 2♥), facing 50 bet into 150 pot",
             game_state=game_state,
             agent_response=smart_response,
@@ -241,7 +328,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (1.0, "Perfect - explicitly calculated pot odds (3:1) and equity (~36%)"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.9, "Call size is reasonable")
             },
-            overall_score=0.94,
             benchmark_label="flop_draw_pot_odds"
         )
     
@@ -268,7 +354,7 @@ class EvaluationExamples:
             "reasoning": "Only high card on scary board. Opponent betting large on river likely has strong hand. Folding."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="River with only high card (J♣ 9♦) on K♠ Q♥ 10♠ 8♣ 7♦ board, facing 200 bet into 500 pot",
             game_state=game_state,
             agent_response=tagbot_response,
@@ -284,7 +370,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.7, "Implicitly considered (folding when pot odds don't justify call)"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.9, "Preserving chips")
             },
-            overall_score=0.87,
             benchmark_label="river_weak_hand"
         )
     
@@ -311,7 +396,7 @@ class EvaluationExamples:
             "reasoning": "Short stack (50 chips, 5% of starting stack). Strong hand (AK). Push-or-fold situation. All-in is correct."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Preflop with A♠ K♥, short stack (50 chips), facing 20 bet",
             game_state=game_state,
             agent_response=adaptive_response,
@@ -327,7 +412,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.7, "Implicitly considered"),
                 AssessmentDimension.STACK_MANAGEMENT: (1.0, "Perfect - recognizes short stack and applies push-or-fold")
             },
-            overall_score=0.93,
             benchmark_label="short_stack_all_in"
         )
     
@@ -354,7 +438,7 @@ class EvaluationExamples:
             "reasoning": "Strong hand (KQ) in excellent position (button). Can raise to steal blinds or build pot."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Preflop with K♠ Q♥ on button (best position)",
             game_state=game_state,
             agent_response=position_response,
@@ -370,7 +454,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (0.7, "Not explicitly calculated"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.85, "Reasonable bet size")
             },
-            overall_score=0.92,
             benchmark_label="position_awareness"
         )
     
@@ -397,7 +480,7 @@ class EvaluationExamples:
             "reasoning": "Flush draw with 9 outs. Pot: 300, Bet: 100, Total pot if call: 500. Pot odds: 500:100 = 5:1. Need 16.7% equity. Have ~20% (9/46). Call is profitable."
         }
         
-        return EvaluationExample(
+        return EvaluationExample.from_assessments(
             scenario_description="Turn with flush draw (6♠ 5♠ on A♠ K♠ 7♠ 2♥), facing 100 bet into 300 pot",
             game_state=game_state,
             agent_response=pot_odds_response,
@@ -413,7 +496,6 @@ class EvaluationExamples:
                 AssessmentDimension.POT_ODDS_AWARENESS: (1.0, "Perfect - explicitly calculated pot odds (5:1), equity (~20%), and break-even point (16.7%)"),
                 AssessmentDimension.STACK_MANAGEMENT: (0.9, "Call size is reasonable")
             },
-            overall_score=0.93,
             benchmark_label="pot_odds_calculation"
         )
 
@@ -466,3 +548,7 @@ def get_ground_truth_test_cases() -> Dict[str, Dict[str, Any]]:
         }
     }
 
+
+if __name__ == "__main__":
+    freeze_examples()
+    print(f"Wrote {FROZEN_EXAMPLES_PATH}")
@@ -1,7 +1,14 @@
 """White agent implementation - the target agent being tested."""
 
+import asyncio
 import json
 import os
+import re
+import sys
+from collections import OrderedDict, deque
+from typing import List, Optional
+import httpx
+import litellm
 import uvicorn
 import dotenv
 from a2a.server.apps import A2AStarletteApplication
@@ -11,13 +18,94 @@ from a2a.server.events import EventQueue
 from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import AgentSkill, AgentCard, AgentCapabilities
 from a2a.utils import new_agent_text_message
-from litellm import completion
+from litellm import acompletion
 
 from .strategies import get_strategy, PokerStrategy
 
+# orjson is optional (faster parse/dump); fall back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 dotenv.load_dotenv()
 
+# Environment overrides, resolved once after .env has been loaded
+_AGENT_URL_OVERRIDE: Optional[str] = os.getenv("AGENT_URL")
+_AGENT_TYPE_OVERRIDE: Optional[str] = os.getenv("AGENT_TYPE")
+
+# One pooled client for all LLM calls so concurrent contexts share keep-alive connections
+litellm.aclient_session = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+
+# Patterns used to strip markdown fences and pull the decision object out of LLM replies
+_RE_FENCE_OPEN = re.compile(r'```(?:json)?\s*')
+_RE_FENCE_CLOSE = re.compile(r'```\s*$')
+
+_SYSTEM_PROMPT_POKER = """You are a poker-playing AI agent. You must respond ONLY with valid JSON in this exact format:
+{
+  "action": "fold|call|raise",
+  "amount": <number>,
+  "confidence": <0.0-1.0>,
+  "reasoning": "<brief explanation>"
+}
+
+CRITICAL: Respond with ONLY the JSON object. Do NOT wrap it in markdown code blocks, do NOT include any other text, explanations, or formatting. Just the raw JSON."""
+
+# Chat message keys/roles, interned so every message dict shares the same key objects
+_KEY_ROLE = sys.intern("role")
+_KEY_CONTENT = sys.intern("content")
+_ROLE_SYSTEM = sys.intern("system")
+_ROLE_USER = sys.intern("user")
+_ROLE_ASSISTANT = sys.intern("assistant")
+
+_SYSTEM_MESSAGE_POKER = {_KEY_ROLE: _ROLE_SYSTEM, _KEY_CONTENT: _SYSTEM_PROMPT_POKER}
+
+
+def _extract_first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} block containing "action", scanning the text once"""
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            if depth > 0:
+                in_string = True
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                candidate = text[start:i + 1]
+                if '"action"' in candidate:
+                    return candidate
+    return None
+
 
 def prepare_white_agent_card(url):
     skill = AgentSkill(
@@ -31,7 +119,7 @@ def prepare_white_agent_card(url):
     # the AGENT_URL environment variable. Prefer that over any local URL derived
     # from host/port so the card always advertises the correct externally
     # reachable address (mirrors agentify-example-tau-bench).
-    public_url = os.getenv("AGENT_URL") or url
+    public_url = _AGENT_URL_OVERRIDE or url
 
     card = AgentCard(
         name="file_agent",
@@ -54,31 +142,55 @@ class GeneralWhiteAgentExecutor(AgentExecutor):
     - Each context_id maintains its own conversation history in ctx_id_to_messages
     - When green agent creates a new context_id (e.g., for a new tournament),
       this automatically starts a fresh conversation thread
-    - Old context_ids remain in memory but won't be accessed after reset
+    - Only the most recent MAX_CONTEXTS context_ids are kept; each history is a
+      bounded deque of the last MAX_HISTORY_TURNS exchanges, with the poker
+      system prompt prepended when the history is sent to the LLM
     """
+    MAX_HISTORY_TURNS = 16  # user/assistant pairs re-sent to the LLM (plus the system message)
+    MAX_CONTEXTS = 256  # least recently used context_ids are evicted beyond this
+
     def __init__(self, agent_type: str = "openai"):
         self.agent_type = agent_type
         self.strategy: PokerStrategy = get_strategy(agent_type)
-        self.ctx_id_to_messages = {}  # Maps context_id -> list of messages (conversation history)
-        self.ctx_id_to_game_state = {}  # Maps context_id -> current game state
+        self.ctx_id_to_messages = OrderedDict()  # Maps context_id -> deque of messages (conversation history)
+        self.ctx_id_to_game_state = OrderedDict()  # Maps context_id -> current game state
+        self.ctx_id_to_has_system = set()  # context_ids whose LLM calls lead with the poker system prompt
+
+    def _touch_context(self, context_id: str) -> deque:
+        """Get (or create) a context's history, marking it most recently used"""
+        if context_id in self.ctx_id_to_messages:
+            self.ctx_id_to_messages.move_to_end(context_id)
+            return self.ctx_id_to_messages[context_id]
+        messages = self.ctx_id_to_messages[context_id] = deque(maxlen=self.MAX_HISTORY_TURNS * 2)
+        while len(self.ctx_id_to_messages) > self.MAX_CONTEXTS:
+            old_id, _ = self.ctx_id_to_messages.popitem(last=False)
+            self.ctx_id_to_game_state.pop(old_id, None)
+            self.ctx_id_to_has_system.discard(old_id)
+        return messages
+
+    def _llm_messages(self, context_id: str, messages: deque) -> list:
+        """History as a list for the LLM, led by the poker system prompt once it applies"""
+        if context_id in self.ctx_id_to_has_system:
+            return [_SYSTEM_MESSAGE_POKER, *messages]
+        return list(messages)
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         # parse the task
         user_input = context.get_user_input()
-        if context.context_id not in self.ctx_id_to_messages:
-            self.ctx_id_to_messages[context.context_id] = []
-        messages = self.ctx_id_to_messages[context.context_id]
-        
-        # Check if this is a poker game state (JSON format)
-        try:
-            game_data = json.loads(user_input)
-            if "game_state" in game_data and "player_cards" in game_data:
-                # This is a poker game state, handle it specially
-                response = await self._handle_poker_decision(game_data, context.context_id)
-            else:
-                # Regular conversation
-                response = await self._handle_regular_conversation(user_input, context.context_id)
-        except json.JSONDecodeError:
+        
+        # Check if this is a poker game state (JSON format); plain text never
+        # starts with a brace, so skip the parse attempt for it entirely
+        game_data = None
+        if user_input.lstrip()[:1] in ("{", "["):
+            try:
+                game_data = _json_loads(user_input)
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+                pass
+        
+        if isinstance(game_data, dict) and "game_state" in game_data and "player_cards" in game_data:
+            # This is a poker game state, handle it specially
+            response = await self._handle_poker_decision(game_data, context.context_id)
+        else:
             # Regular conversation
             response = await self._handle_regular_conversation(user_input, context.context_id)
         
@@ -90,111 +202,125 @@ class GeneralWhiteAgentExecutor(AgentExecutor):
 
     async def _handle_poker_decision(self, game_data: dict, context_id: str) -> str:
         """Handle poker game decision with proper context"""
-        # Store current game state
-        self.ctx_id_to_game_state[context_id] = game_data
-        
-        # If we have a strategy (non-OpenAI agent), use it
+        # If we have a strategy (non-OpenAI agent), use it - it needs no
+        # conversation history, so skip all per-context bookkeeping
         if self.strategy:
-            # Extract player chips from game state if available
-            game_state = game_data.get("game_state", {})
-            players = game_data.get("players", [])
-            player_id = None  # We'll need to identify the player somehow
-            
-            # Try to find player chips from the game state structure
-            player_chips = 1000  # Default
-            if "your_chips" in game_data:
-                player_chips = game_data["your_chips"]
-            
-            # Add player_chips to game_data for strategy
-            game_data["player_chips"] = player_chips
-            
-            decision = self.strategy.make_decision(game_data)
-            return json.dumps(decision)
+            return self._strategy_decision(game_data)
         
         # Otherwise use OpenAI LLM
-        messages = self.ctx_id_to_messages[context_id]
+        messages = self._touch_context(context_id)
         
-        # Add system message if this is the first poker message
-        if not any(msg.get("role") == "system" for msg in messages):
-            messages.insert(0, {
-                "role": "system",
-                "content": """You are a poker-playing AI agent. You must respond ONLY with valid JSON in this exact format:
-{
-  "action": "fold|call|raise",
-  "amount": <number>,
-  "confidence": <0.0-1.0>,
-  "reasoning": "<brief explanation>"
-}
-
-CRITICAL: Respond with ONLY the JSON object. Do NOT wrap it in markdown code blocks, do NOT include any other text, explanations, or formatting. Just the raw JSON."""
-            })
+        # Store current game state
+        self.ctx_id_to_game_state[context_id] = game_data
+        
+        # Lead with the system message from the first poker message onwards
+        self.ctx_id_to_has_system.add(context_id)
         
         # Add current game state
         messages.append({
-            "role": "user", 
-            "content": f"Poker game state: {json.dumps(game_data, indent=2)}"
+            _KEY_ROLE: _ROLE_USER,
+            _KEY_CONTENT: f"Poker game state: {_json_dumps(game_data)}"
         })
         
-        response = completion(
-            messages=messages,
+        response = await acompletion(
+            messages=self._llm_messages(context_id, messages),
             model="openai/gpt-4o",
             custom_llm_provider="openai",
             temperature=0.1,  # Lower temperature for more consistent JSON
         )
         
         next_message = response.choices[0].message.model_dump()
-        content = next_message["content"]
+        content = next_message[_KEY_CONTENT]
         
         # Clean up the response to ensure it's pure JSON
         content = self._clean_json_response(content)
         
         messages.append({
-            "role": "assistant",
-            "content": content,
+            _KEY_ROLE: _ROLE_ASSISTANT,
+            _KEY_CONTENT: content,
         })
         
         return content
 
+    def _strategy_decision(self, game_data: dict) -> str:
+        """Decide with the local PokerStrategy"""
+        # Add player_chips to game_data for strategy (default 1000)
+        game_data["player_chips"] = game_data.get("your_chips", 1000)
+        
+        decision = self.strategy.make_decision(game_data)
+        return _json_dumps(decision)
+
+    async def batch_execute(self, game_datas: List[dict]) -> List[str]:
+        """Decide several independent poker scenarios at once (e.g. benchmark replays)"""
+        return await self._handle_poker_decisions_batch(game_datas)
+
+    async def _handle_poker_decisions_batch(self, game_datas: List[dict]) -> List[str]:
+        """Handle independent poker decisions concurrently, each in its own fresh thread"""
+        if self.strategy:
+            for game_data in game_datas:
+                game_data["player_chips"] = game_data.get("your_chips", 1000)
+            return [_json_dumps(decision) for decision in self.strategy.make_decisions(game_datas)]
+        
+        responses = await asyncio.gather(*(
+            acompletion(
+                messages=[
+                    _SYSTEM_MESSAGE_POKER,
+                    {_KEY_ROLE: _ROLE_USER, _KEY_CONTENT: f"Poker game state: {_json_dumps(game_data)}"},
+                ],
+                model="openai/gpt-4o",
+                custom_llm_provider="openai",
+                temperature=0.1,
+            )
+            for game_data in game_datas
+        ))
+        return [
+            self._clean_json_response(response.choices[0].message.model_dump()[_KEY_CONTENT])
+            for response in responses
+        ]
+
     def _clean_json_response(self, content: str) -> str:
         """Clean up the response to ensure it's pure JSON"""
-        import re
+        # Fast path: the model usually returns the bare JSON object already
+        stripped = content.strip()
+        if stripped[:1] == "{" and stripped[-1:] == "}" and '"action"' in stripped:
+            return stripped
         
         # Remove markdown code blocks if present
-        content = re.sub(r'```(?:json)?\s*', '', content)
-        content = re.sub(r'```\s*$', '', content)
+        content = _RE_FENCE_OPEN.sub('', content)
+        content = _RE_FENCE_CLOSE.sub('', content)
         
         # Remove any leading/trailing whitespace
         content = content.strip()
         
         # Try to find JSON object in the response
-        json_match = re.search(r'\{[^{}]*"action"[^{}]*\}', content, re.DOTALL)
-        if json_match:
-            return json_match.group(0).strip()
+        json_obj = _extract_first_json_object(content)
+        if json_obj is not None:
+            return json_obj
         
         return content
 
     async def _handle_regular_conversation(self, user_input: str, context_id: str) -> str:
         """Handle regular conversation"""
-        messages = self.ctx_id_to_messages[context_id]
+        messages = self._touch_context(context_id)
         messages.append({
-            "role": "user",
-            "content": user_input,
+            _KEY_ROLE: _ROLE_USER,
+            _KEY_CONTENT: user_input,
         })
         
-        response = completion(
-            messages=messages,
+        response = await acompletion(
+            messages=self._llm_messages(context_id, messages),
             model="openai/gpt-4o",
             custom_llm_provider="openai",
             temperature=0.0,
         )
         
-        next_message = response.choices[0].message.model_dump()
+        content = response.choices[0].message.model_dump()[_KEY_CONTENT]
         messages.append({
-            "role": "assistant",
-            "content": next_message["content"],
+            _KEY_ROLE: _ROLE_ASSISTANT,
+            _KEY_CONTENT: content,
         })
         
-        return next_message["content"]
+        return content
 
     async def cancel(self, context, event_queue) -> None:
         raise NotImplementedError
@@ -207,7 +333,7 @@ def start_white_agent(agent_name="general_white_agent", host="localhost", port=9
     card = prepare_white_agent_card(url)
 
     # Get agent type from environment or parameter
-    agent_type = os.getenv("AGENT_TYPE", agent_type)
+    agent_type = _AGENT_TYPE_OVERRIDE or agent_type
     
     request_handler = DefaultRequestHandler(
         agent_executor=GeneralWhiteAgentExecutor(agent_type=agent_type),
@@ -1,7 +1,125 @@
 """Different poker playing strategies for white agents"""
 import json
 import random
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+# Rank lookup shared by every strategy: _RANK_LUT[ord(card_str[0])] -> 2..14 (0 for
+# anything else). A bytes literal, so each lookup is a single byte subscript.
+_RANK_LUT = (
+    b"\x00" * 49
+    + b"\x0a"  # '1' - "10♠" is the only rank starting with '1'
+    + b"\x02\x03\x04\x05\x06\x07\x08\x09"  # '2'..'9'
+    + b"\x00" * 7
+    + b"\x0e"  # 'A'
+    + b"\x00" * 8
+    + b"\x0b\x0d"  # 'J', 'K'
+    + b"\x00" * 5
+    + b"\x0c"  # 'Q'
+    + b"\x00" * 2
+    + b"\x0a"  # 'T'
+    + b"\x00" * 171
+)
+
+# Made-hand categories, weakest to strongest. Each strategy maps them to its own
+# strength/equity through a tuple indexed by category.
+(HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE,
+ FOUR_OF_A_KIND, STRAIGHT_FLUSH) = range(9)
+
+# Suit from the last character of a card string ("10♠" has a two-character rank)
+_SUIT_INDEX = {"♠": 0, "♥": 1, "♦": 2, "♣": 3, "s": 0, "h": 1, "d": 2, "c": 3}
+
+# Rank bitmask of the wheel A-2-3-4-5 (the ace plays low)
+_WHEEL_MASK = (1 << 14) | 0x3C
+
+
+def _straight_high(rank_mask: int) -> int:
+    """Top rank of the best straight in a rank bitmask, or 0 if there is none"""
+    # Bit r survives only when ranks r..r+4 are all present (SWAR run detection)
+    runs = rank_mask & (rank_mask >> 1) & (rank_mask >> 2) & (rank_mask >> 3) & (rank_mask >> 4)
+    if runs:
+        return runs.bit_length() + 3
+    return 5 if rank_mask & _WHEEL_MASK == _WHEEL_MASK else 0
+
+
+def _classify_cards(cards: Iterable[str]) -> Tuple[int, Tuple[int, ...]]:
+    """Classify card strings (shared by every strategy); returns (category, sorted ranks)"""
+    ranks = []
+    rank_mask = 0
+    suit_masks = [0, 0, 0, 0]
+    for card_str in cards:
+        rank = _RANK_LUT[ord(card_str[0])]
+        ranks.append(rank)
+        bit = 1 << rank
+        rank_mask |= bit
+        suit = _SUIT_INDEX.get(card_str[-1])
+        if suit is not None:
+            suit_masks[suit] |= bit
+    ranks_key = tuple(sorted(ranks))
+    category = _category_for_ranks(ranks_key)
+    if len(ranks_key) < 5:
+        return category, ranks_key
+    
+    for suit_mask in suit_masks:
+        if bin(suit_mask).count("1") >= 5:
+            if _straight_high(suit_mask):
+                return STRAIGHT_FLUSH, ranks_key
+            return max(category, FLUSH), ranks_key
+    if category < STRAIGHT and _straight_high(rank_mask):
+        return STRAIGHT, ranks_key
+    return category, ranks_key
+
+
+@lru_cache(maxsize=8192)
+def _category_for_ranks(ranks_key: Tuple[int, ...]) -> int:
+    """Cached classification by rank multiplicity alone, keyed on the sorted rank tuple"""
+    # Rank bitmasks: bit r of mN is set when rank r appears at least N times
+    m1 = m2 = m3 = m4 = 0
+    for rank in ranks_key:
+        bit = 1 << rank
+        m4 |= m3 & bit
+        m3 |= m2 & bit
+        m2 |= m1 & bit
+        m1 |= bit
+    if m4:
+        return FOUR_OF_A_KIND
+    if m3:
+        # Another rank paired (or a second set of trips) makes a full house
+        return FULL_HOUSE if m2 & (m2 - 1) else THREE_OF_A_KIND
+    if m2:
+        return TWO_PAIR if m2 & (m2 - 1) else ONE_PAIR
+    return HIGH_CARD
+
+
+# Cards used by the made part of each multiplicity category (the rest of a five-card
+# hand are kickers); straights are valued by their top rank alone
+_MADE_GROUPS = (0, 1, 2, 1, 0, 0, 2, 1, 0)
+_MADE_CARDS = (0, 2, 4, 3, 5, 5, 5, 4, 5)
+
+
+@lru_cache(maxsize=65536)
+def _hand_value(ranks_key: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Comparable (suit-blind) value of a sorted rank tuple: category, made ranks, then kickers"""
+    category = _category_for_ranks(ranks_key)
+    counts = [0] * 15
+    rank_mask = 0
+    for rank in ranks_key:
+        counts[rank] += 1
+        rank_mask |= 1 << rank
+    if category < STRAIGHT:
+        straight_high = _straight_high(rank_mask)
+        if straight_high:
+            return (STRAIGHT, straight_high)
+    groups = sorted(((count, rank) for rank, count in enumerate(counts) if count), reverse=True)
+    made = [rank for _, rank in groups[:_MADE_GROUPS[category]]]
+    kickers = sorted({rank for rank in ranks_key if rank not in made}, reverse=True)
+    return (category, *made, *kickers[:5 - _MADE_CARDS[category]])
+
+
+# Shared read-only default for missing nested dicts (e.g. game_state), never mutated
+_EMPTY_DICT: Dict[str, Any] = {}
 
 
 class PokerStrategy:
@@ -10,34 +128,88 @@ class PokerStrategy:
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a poker decision based on game state"""
         raise NotImplementedError
+    
+    def make_decisions(self, game_datas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Make decisions for a batch of independent game states (self-play / benchmark replays)"""
+        decide = self.make_decision
+        return [decide(game_data) for game_data in game_datas]
 
 
-class TAGBotStrategy(PokerStrategy):
+class _HandStrengthMixin:
+    """Shared hand scoring; each strategy only supplies its weight tables"""
+    
+    # Strength by hand category (high card, pair, two pair, trips, straight, flush,
+    # full house, quads, straight flush)
+    _CATEGORY_STRENGTH = (0.0, 0.4, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 1.0)
+    _HIGH_CARD_BONUS = 0.0  # Weight of (max rank / 14) added on top
+    # Hole-card-only scoring: (high card weight, pair bonus, face card bonus, bias)
+    _HOLE_CARD_WEIGHTS = (0.5, 0.3, 0.2, 0.0)
+    
+    def _score_hand(self, player_cards: list, community_cards: list) -> float:
+        """Score hole + board cards by made-hand category plus a high card bonus"""
+        if not community_cards and len(player_cards) == 2:
+            # Preflop: two cards can only be a pocket pair or high card
+            rank1 = _RANK_LUT[ord(player_cards[0][0])]
+            rank2 = _RANK_LUT[ord(player_cards[1][0])]
+            if rank1 == rank2:
+                strength = self._CATEGORY_STRENGTH[ONE_PAIR]
+            else:
+                strength = self._CATEGORY_STRENGTH[HIGH_CARD]
+            strength += (max(rank1, rank2) / 14.0) * self._HIGH_CARD_BONUS
+            return min(strength, 1.0)
+        
+        # The sorted key feeds the category cache and already ends with the high card
+        category, ranks_key = _classify_cards(chain(player_cards, community_cards))
+        strength = self._CATEGORY_STRENGTH[category]
+        strength += (ranks_key[-1] / 14.0) * self._HIGH_CARD_BONUS
+        return min(strength, 1.0)
+    
+    def _score_hole_cards(self, player_cards: list) -> float:
+        """Score hole cards alone from the high card, a pocket pair and face cards"""
+        high_card_weight, pair_bonus, face_bonus, bias = self._HOLE_CARD_WEIGHTS
+        ranks = []
+        max_rank = 0
+        for card_str in player_cards:
+            rank = _RANK_LUT[ord(card_str[0])]
+            ranks.append(rank)
+            if rank > max_rank:
+                max_rank = rank
+        is_pair = len(ranks) >= 2 and ranks[0] == ranks[1]
+        
+        strength = (max_rank / 14.0) * high_card_weight
+        if is_pair:
+            strength += pair_bonus
+        if max_rank >= 10:  # Face cards
+            strength += face_bonus
+        
+        return min(strength + bias, 1.0)
+
+
+# Fixed decisions are shared module-level dicts; callers treat decisions as read-only
+_TAG_FOLD_WEAK_TO_BET = {"action": "fold", "amount": 0, "confidence": 0.85, "reasoning": "Tight preflop: folding weak hand to bet"}
+_TAG_FOLD_WEAK = {"action": "fold", "amount": 0, "confidence": 0.8, "reasoning": "Tight preflop: folding weak hand"}
+_TAG_FOLD_MODERATE_PREFLOP = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Moderate hand, bet too high preflop"}
+_TAG_FOLD_WEAK_POSTFLOP = {"action": "fold", "amount": 0, "confidence": 0.8, "reasoning": "Post-flop: folding weak hand (TAGBot tight)"}
+_TAG_FOLD_MODERATE_POSTFLOP = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Post-flop: folding moderate hand to large bet"}
+
+
+class TAGBotStrategy(_HandStrengthMixin, PokerStrategy):
     """Tight-Aggressive Rule-Based Agent - plays conservatively pre-flop, aggressively post-flop when strong"""
     
+    _CATEGORY_STRENGTH = (0.0, 0.4, 0.65, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0)
+    _HIGH_CARD_BONUS = 0.15
+    
     def _evaluate_preflop_strength(self, player_cards: list) -> float:
         """Evaluate preflop hand strength (TAGBot should be very tight)"""
         if not player_cards or len(player_cards) < 2:
             return 0.0
         
-        ranks = []
-        for card_str in player_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
+        ranks = [_RANK_LUT[ord(card_str[0])] for card_str in player_cards]
         
         max_rank = max(ranks)
         min_rank = min(ranks)
-        is_pair = len(set(ranks)) == 1
-        suited = len(set([c[1] if len(c) > 1 else c[-1] for c in player_cards])) == 1
+        is_pair = ranks[0] == ranks[1]
+        suited = player_cards[0][-1] == player_cards[1][-1]
         
         # TAGBot preflop: Only premium hands get high strength
         if is_pair:
@@ -71,54 +243,18 @@ class TAGBotStrategy(PokerStrategy):
         """Evaluate postflop hand strength"""
         if not player_cards or not community_cards:
             return 0.0
-        
-        all_cards = player_cards + community_cards
-        
-        # Extract ranks
-        ranks = []
-        for card_str in all_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        from collections import Counter
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        
-        strength = 0.0
-        if counts[0] >= 2:  # Pair
-            strength = 0.4
-        if counts[0] >= 3:  # Three of a kind
-            strength = 0.75
-        if counts[0] >= 4:  # Four of a kind
-            strength = 0.95
-        if len(counts) >= 2 and counts[0] >= 2 and counts[1] >= 2:  # Two pair
-            strength = 0.65
-        if counts[0] >= 3 and counts[1] >= 2:  # Full house
-            strength = 0.9
-        
-        max_rank = max(ranks)
-        strength += (max_rank / 14.0) * 0.15
-        
-        return min(strength, 1.0)
+        return self._score_hand(player_cards, community_cards)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        community_cards = game_data.get("community_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
-        round_name = game_data.get("game_state", {}).get("round", "preflop")
-        player_position = game_data.get("player_position", 0)
-        amount_to_call = current_bet - game_data.get("your_current_bet", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        community_cards = g("community_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
+        round_name = (g("game_state") or _EMPTY_DICT).get("round", "preflop")
+        player_position = g("player_position", 0)
+        amount_to_call = current_bet - g("your_current_bet", 0)
         
         is_preflop = round_name == "preflop"
         
@@ -134,20 +270,10 @@ class TAGBotStrategy(PokerStrategy):
             if adjusted_strength < 0.6:
                 # Fold weak/marginal hands, especially to raises
                 if current_bet > 0:  # Facing a bet/raise
-                    return {
-                        "action": "fold",
-                        "amount": 0,
-                        "confidence": 0.85,
-                        "reasoning": "Tight preflop: folding weak hand to bet"
-                    }
+                    return _TAG_FOLD_WEAK_TO_BET
                 else:  # Can check or limp
                     if adjusted_strength < 0.4:
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "confidence": 0.8,
-                            "reasoning": "Tight preflop: folding weak hand"
-                        }
+                        return _TAG_FOLD_WEAK
                     else:
                         return {
                             "action": "call",
@@ -158,12 +284,7 @@ class TAGBotStrategy(PokerStrategy):
             elif adjusted_strength < 0.75:
                 # Moderate hands - call small bets, fold to raises
                 if current_bet > pot_size * 0.3 or amount_to_call > player_chips * 0.1:
-                    return {
-                        "action": "fold",
-                        "amount": 0,
-                        "confidence": 0.7,
-                        "reasoning": "Moderate hand, bet too high preflop"
-                    }
+                    return _TAG_FOLD_MODERATE_PREFLOP
                 else:
                     return {
                         "action": "call",
@@ -173,7 +294,7 @@ class TAGBotStrategy(PokerStrategy):
                     }
             else:  # Strong preflop hand (premium)
                 # TAGBot: Aggressive with strong hands
-                raise_amount = int(current_bet * 2.5) if current_bet > 0 else 80
+                raise_amount = current_bet * 5 // 2 if current_bet > 0 else 80
                 max_affordable = player_chips + amount_to_call
                 raise_to = min(raise_amount, max_affordable)
                 return {
@@ -199,12 +320,7 @@ class TAGBotStrategy(PokerStrategy):
                         "reasoning": "Post-flop: calling with excellent pot odds"
                     }
                 else:
-                    return {
-                        "action": "fold",
-                        "amount": 0,
-                        "confidence": 0.8,
-                        "reasoning": "Post-flop: folding weak hand (TAGBot tight)"
-                    }
+                    return _TAG_FOLD_WEAK_POSTFLOP
             elif hand_strength < 0.6:
                 # Moderate strength - check/call, don't bet into aggression
                 if current_bet > 0:
@@ -218,15 +334,10 @@ class TAGBotStrategy(PokerStrategy):
                             "reasoning": "Post-flop: calling with moderate hand and decent pot odds"
                         }
                     else:
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "confidence": 0.7,
-                            "reasoning": "Post-flop: folding moderate hand to large bet"
-                        }
+                        return _TAG_FOLD_MODERATE_POSTFLOP
                 else:
                     # No bet - TAGBot can value bet
-                    raise_amount = int(current_bet * 1.5) if current_bet > 0 else 60
+                    raise_amount = current_bet * 3 // 2 if current_bet > 0 else 60
                     max_affordable = player_chips + amount_to_call
                     raise_to = min(raise_amount, max_affordable)
                     return {
@@ -237,7 +348,7 @@ class TAGBotStrategy(PokerStrategy):
                     }
             else:  # Very strong post-flop
                 # TAGBot: Aggressive with strong hands
-                raise_amount = int(current_bet * 2.5) if current_bet > 0 else 100
+                raise_amount = current_bet * 5 // 2 if current_bet > 0 else 100
                 max_affordable = player_chips + amount_to_call
                 raise_to = min(raise_amount, max_affordable)
                 return {
@@ -251,49 +362,64 @@ class TAGBotStrategy(PokerStrategy):
 class MonteCarloStrategy(PokerStrategy):
     """Monte Carlo Simulation Agent - simulates random outcomes to evaluate EV"""
     
-    def _simulate_equity(self, player_cards: list, community_cards: list, num_simulations: int = 1000) -> float:
-        """Monte Carlo simulation to estimate hand equity"""
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)  # Per-instance RNG; pass a seed for reproducible runs
+        self._sample = self._rng.sample
+        # The simulation only sees ranks, so spots with the same sorted hole/board ranks
+        # share one estimate
+        self._cached_equity = lru_cache(maxsize=4096)(self._run_equity)
+    
+    def _simulate_equity(self, player_cards: list, community_cards: list, num_simulations: int = 1000,
+                         num_opponents: int = 1) -> float:
+        """Monte Carlo simulation to estimate hand equity against random opponent hands"""
         if not player_cards:
             return 0.0
         
-        # Simplified equity calculation
-        # In full implementation, would simulate random opponent hands and runouts
-        all_cards = player_cards + community_cards
-        
-        ranks = []
-        for card_str in all_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
+        hole = tuple(sorted([_RANK_LUT[ord(card_str[0])] for card_str in player_cards]))
+        board = tuple(sorted([_RANK_LUT[ord(card_str[0])] for card_str in community_cards]))
+        return self._cached_equity(hole, board, num_simulations, num_opponents)
+    
+    def _run_equity(self, hole_key: Tuple[int, ...], board_key: Tuple[int, ...], num_simulations: int,
+                    num_opponents: int) -> float:
+        """Run the simulation for a canonical (sorted ranks) hole/board spot"""
+        hole = list(hole_key)
+        board = list(board_key)
+        
+        # Rank-only deck: the simulation does not score flushes, so four copies of each
+        # rank is an exact model. Build it in one pass from the copies left unseen.
+        unseen = [4] * 15
+        for rank in hole_key + board_key:
+            unseen[rank] -= 1
+        deck = [rank for rank in range(2, 15) for _ in range(unseen[rank])]
+        
+        board_needed = 5 - len(board)
+        draw_size = board_needed + 2 * num_opponents
+        sample = self._sample
+        
+        # Draw every run-out up front, then score the batch; on the river our own
+        # hand is the same in every run-out, so it is valued once
+        runouts = [sample(deck, draw_size) for _ in range(num_simulations)]
+        known = hole + board
+        fixed_ours = _hand_value(tuple(sorted(known))) if not board_needed else None
+        
+        wins = 0.0
+        for drawn in runouts:
+            if fixed_ours is None:
+                full_board = board + drawn[:board_needed]
+                ours = _hand_value(tuple(sorted(known + drawn[:board_needed])))
             else:
-                ranks.append(int(rank_char))
-        
-        from collections import Counter
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        
-        # Estimate equity based on current hand strength
-        equity = 0.0
-        if counts[0] >= 2:  # Pair
-            equity = 0.55  # Slight favorite
-        if counts[0] >= 3:  # Three of a kind
-            equity = 0.75
-        if counts[0] >= 4:  # Four of a kind
-            equity = 0.95
-        if len(counts) >= 2 and counts[0] >= 2 and counts[1] >= 2:  # Two pair
-            equity = 0.65
-        if counts[0] >= 3 and counts[1] >= 2:  # Full house
-            equity = 0.9
-        
-        # Add some randomness to simulate MC variance
-        equity += random.uniform(-0.1, 0.1)
-        return max(0.0, min(1.0, equity))
+                full_board = board
+                ours = fixed_ours
+            best_opponent = max(
+                _hand_value(tuple(sorted(drawn[i:i + 2] + full_board)))
+                for i in range(board_needed, draw_size, 2)
+            )
+            if ours > best_opponent:
+                wins += 1.0
+            elif ours == best_opponent:
+                wins += 0.5
+        
+        return wins / num_simulations
     
     def _calculate_ev(self, equity: float, pot_size: int, bet_amount: int) -> float:
         """Calculate expected value"""
@@ -303,11 +429,12 @@ class MonteCarloStrategy(PokerStrategy):
         return ev
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        community_cards = game_data.get("community_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        community_cards = g("community_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
         
         # Monte Carlo simulation
         equity = self._simulate_equity(player_cards, community_cards, num_simulations=1000)
@@ -319,7 +446,7 @@ class MonteCarloStrategy(PokerStrategy):
         
         # For raise, estimate opponent fold probability (simplified)
         opponent_fold_prob = 0.3  # Assume 30% fold to raise
-        raise_amount = int(current_bet * 2) if current_bet > 0 else 100
+        raise_amount = current_bet * 2 if current_bet > 0 else 100
         raise_ev = (opponent_fold_prob * pot_size) + ((1 - opponent_fold_prob) * self._calculate_ev(equity, pot_size + raise_amount, raise_amount))
         
         # Decision = argmax(EV)
@@ -346,58 +473,46 @@ class MonteCarloStrategy(PokerStrategy):
             }
 
 
-class ManiacStrategy(PokerStrategy):
+_MANIAC_FOLD = {"action": "fold", "amount": 0, "confidence": 0.3, "reasoning": "Maniac: Rare fold (very weak hand)"}
+
+
+class ManiacStrategy(_HandStrengthMixin, PokerStrategy):
     """Ultra-aggressive LAG player - raises frequently, high bluff frequency"""
     
+    _HOLE_CARD_WEIGHTS = (0.3, 0.2, 0.1, 0.2)  # Maniac bias: always thinks hand is better
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)  # Per-instance RNG; pass a seed for reproducible runs
+        self._rand = self._rng.random
+        self._uniform = self._rng.uniform
+        self._randint = self._rng.randint
+    
     def _evaluate_hand_strength(self, player_cards: list) -> float:
         """Simple hand strength (maniac doesn't care much)"""
         if not player_cards:
             return 0.3  # Maniac is optimistic
-        
-        ranks = []
-        for card_str in player_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        max_rank = max(ranks)
-        is_pair = len(set(ranks)) == 1
-        
-        strength = (max_rank / 14.0) * 0.3
-        if is_pair:
-            strength += 0.2
-        if max_rank >= 10:
-            strength += 0.1
-        
-        return min(strength + 0.2, 1.0)  # Maniac bias: always thinks hand is better
+        return self._score_hole_cards(player_cards)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
         
         hand_strength = self._evaluate_hand_strength(player_cards)
         
         # Maniac: 70% chance to raise regardless of hand
-        if random.random() < 0.7:
+        if self._rand() < 0.7:
             # Ultra-aggressive raise
-            raise_amount = int(current_bet * random.uniform(2.5, 4.0)) if current_bet > 0 else random.randint(100, 200)
+            raise_amount = int(current_bet * self._uniform(2.5, 4.0)) if current_bet > 0 else self._randint(100, 200)
             return {
                 "action": "raise",
                 "amount": min(raise_amount, player_chips),
                 "confidence": 0.6,  # Maniac is confident but not smart
                 "reasoning": "Maniac: Aggressive raise to put pressure"
             }
-        elif random.random() < 0.8:  # 80% of remaining cases = call
+        elif self._rand() < 0.8:  # 80% of remaining cases = call
             return {
                 "action": "call",
                 "amount": min(current_bet, player_chips),
@@ -405,73 +520,37 @@ class ManiacStrategy(PokerStrategy):
                 "reasoning": "Maniac: Calling to see more cards"
             }
         else:  # Rare fold
-            return {
-                "action": "fold",
-                "amount": 0,
-                "confidence": 0.3,
-                "reasoning": "Maniac: Rare fold (very weak hand)"
-            }
+            return _MANIAC_FOLD
+
 
+_CONSERVATIVE_FOLD_WEAK = {"action": "fold", "amount": 0, "confidence": 0.8, "reasoning": "Weak hand, folding conservatively"}
+_CONSERVATIVE_FOLD_MODERATE = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Moderate hand, but bet too high"}
 
-class ConservativeStrategy(PokerStrategy):
+
+class ConservativeStrategy(_HandStrengthMixin, PokerStrategy):
     """Conservative strategy - folds often, small bets"""
     
     def _evaluate_hand_strength(self, player_cards: list) -> float:
         """Simple hand strength evaluation"""
         if not player_cards:
             return 0.0
-        
-        # Extract ranks
-        ranks = []
-        for card_str in player_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        max_rank = max(ranks)
-        is_pair = len(set(ranks)) == 1
-        
-        # Simple strength calculation
-        strength = (max_rank / 14.0) * 0.5
-        if is_pair:
-            strength += 0.3
-        if max_rank >= 10:  # Face cards
-            strength += 0.2
-        
-        return min(strength, 1.0)
+        return self._score_hole_cards(player_cards)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
         
         hand_strength = self._evaluate_hand_strength(player_cards)
         
         # Conservative: only play strong hands
         if hand_strength < 0.4:
-            return {
-                "action": "fold",
-                "amount": 0,
-                "confidence": 0.8,
-                "reasoning": "Weak hand, folding conservatively"
-            }
+            return _CONSERVATIVE_FOLD_WEAK
         elif hand_strength < 0.6:
             if current_bet > pot_size * 0.3:  # Too expensive
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "confidence": 0.7,
-                    "reasoning": "Moderate hand, but bet too high"
-                }
+                return _CONSERVATIVE_FOLD_MODERATE
             else:
                 return {
                     "action": "call",
@@ -480,7 +559,7 @@ class ConservativeStrategy(PokerStrategy):
                     "reasoning": "Moderate hand, calling"
                 }
         else:  # Strong hand
-            raise_amount = int(current_bet * 1.5) if current_bet > 0 else 50
+            raise_amount = current_bet * 3 // 2 if current_bet > 0 else 50
             return {
                 "action": "raise",
                 "amount": min(raise_amount, player_chips),
@@ -489,44 +568,24 @@ class ConservativeStrategy(PokerStrategy):
             }
 
 
-class AggressiveStrategy(PokerStrategy):
+_AGGRESSIVE_FOLD_WEAK = {"action": "fold", "amount": 0, "confidence": 0.5, "reasoning": "Very weak hand, folding"}
+
+
+class AggressiveStrategy(_HandStrengthMixin, PokerStrategy):
     """Aggressive strategy - raises often, larger bets"""
     
     def _evaluate_hand_strength(self, player_cards: list) -> float:
         """Simple hand strength evaluation"""
         if not player_cards:
             return 0.0
-        
-        ranks = []
-        for card_str in player_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        max_rank = max(ranks)
-        is_pair = len(set(ranks)) == 1
-        
-        strength = (max_rank / 14.0) * 0.5
-        if is_pair:
-            strength += 0.3
-        if max_rank >= 10:
-            strength += 0.2
-        
-        return min(strength, 1.0)
+        return self._score_hole_cards(player_cards)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
         
         hand_strength = self._evaluate_hand_strength(player_cards)
         
@@ -541,15 +600,10 @@ class AggressiveStrategy(PokerStrategy):
                     "reasoning": "Weak hand but small bet, calling aggressively"
                 }
             else:
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "confidence": 0.5,
-                    "reasoning": "Very weak hand, folding"
-                }
+                return _AGGRESSIVE_FOLD_WEAK
         elif hand_strength < 0.5:
             # Moderate - raise to put pressure
-            raise_amount = int(current_bet * 2.5) if current_bet > 0 else 100
+            raise_amount = current_bet * 5 // 2 if current_bet > 0 else 100
             return {
                 "action": "raise",
                 "amount": min(raise_amount, player_chips),
@@ -557,7 +611,7 @@ class AggressiveStrategy(PokerStrategy):
                 "reasoning": "Moderate hand, raising aggressively"
             }
         else:  # Strong hand
-            raise_amount = int(current_bet * 3) if current_bet > 0 else 150
+            raise_amount = current_bet * 3 if current_bet > 0 else 150
             return {
                 "action": "raise",
                 "amount": min(raise_amount, player_chips),
@@ -566,54 +620,20 @@ class AggressiveStrategy(PokerStrategy):
             }
 
 
-class SmartStrategy(PokerStrategy):
+_SMART_FOLD_WEAK = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Weak hand, poor pot odds"}
+_SMART_FOLD_MODERATE = {"action": "fold", "amount": 0, "confidence": 0.6, "reasoning": "Moderate hand, not worth calling large bet"}
+
+
+class SmartStrategy(_HandStrengthMixin, PokerStrategy):
     """Smart strategy - considers pot odds, position, and hand strength"""
     
+    _HIGH_CARD_BONUS = 0.2
+    
     def _evaluate_hand_strength(self, player_cards: list, community_cards: list) -> float:
         """Evaluate hand strength considering community cards"""
         if not player_cards:
             return 0.0
-        
-        all_cards = player_cards + community_cards
-        
-        # Extract ranks
-        ranks = []
-        for card_str in all_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        # Count pairs, trips, etc.
-        from collections import Counter
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        
-        # Simple strength calculation
-        strength = 0.0
-        if counts[0] >= 2:  # At least a pair
-            strength = 0.4
-        if counts[0] >= 3:  # Three of a kind
-            strength = 0.7
-        if counts[0] >= 4:  # Four of a kind
-            strength = 0.95
-        if len(counts) >= 2 and counts[0] >= 2 and counts[1] >= 2:  # Two pair
-            strength = 0.6
-        if counts[0] >= 3 and counts[1] >= 2:  # Full house
-            strength = 0.9
-        
-        # High card bonus
-        max_rank = max(ranks)
-        strength += (max_rank / 14.0) * 0.2
-        
-        return min(strength, 1.0)
+        return self._score_hand(player_cards, community_cards)
     
     def _calculate_pot_odds(self, bet_amount: int, pot_size: int) -> float:
         """Calculate pot odds"""
@@ -622,12 +642,13 @@ class SmartStrategy(PokerStrategy):
         return bet_amount / (pot_size + bet_amount)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        community_cards = game_data.get("community_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
-        player_position = game_data.get("player_position", 0)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        community_cards = g("community_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
+        player_position = g("player_position", 0)
         
         hand_strength = self._evaluate_hand_strength(player_cards, community_cards)
         pot_odds = self._calculate_pot_odds(current_bet, pot_size) if current_bet > 0 else 0.0
@@ -640,7 +661,7 @@ class SmartStrategy(PokerStrategy):
         adjusted_strength = hand_strength * position_factor
         
         # Calculate amount needed to call
-        amount_to_call = current_bet - game_data.get("your_current_bet", 0)
+        amount_to_call = current_bet - g("your_current_bet", 0)
         max_affordable_raise = player_chips + amount_to_call
         
         # Decision logic
@@ -654,17 +675,12 @@ class SmartStrategy(PokerStrategy):
                     "reasoning": "Weak hand but good pot odds"
                 }
             else:
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "confidence": 0.7,
-                    "reasoning": "Weak hand, poor pot odds"
-                }
+                return _SMART_FOLD_WEAK
         elif adjusted_strength < 0.6:
             # Moderate hand - call or small raise
             if pot_odds < 0.3:
                 # Calculate raise TO amount (total bet)
-                raise_to = int(current_bet * 1.5) if current_bet > 0 else 60
+                raise_to = current_bet * 3 // 2 if current_bet > 0 else 60
                 # Cap to what player can afford
                 raise_to = min(raise_to, max_affordable_raise)
                 
@@ -678,12 +694,7 @@ class SmartStrategy(PokerStrategy):
                             "reasoning": "Moderate hand, can't afford meaningful raise"
                         }
                     else:
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "confidence": 0.6,
-                            "reasoning": "Moderate hand, not worth calling large bet"
-                        }
+                        return _SMART_FOLD_MODERATE
                 
                 return {
                     "action": "raise",
@@ -700,7 +711,7 @@ class SmartStrategy(PokerStrategy):
                 }
         else:  # Strong hand
             # Calculate raise TO amount (total bet)
-            raise_to = int(current_bet * 2) if current_bet > 0 else 100
+            raise_to = current_bet * 2 if current_bet > 0 else 100
             # Cap to what player can afford
             raise_to = min(raise_to, max_affordable_raise)
             
@@ -739,98 +750,83 @@ class SmartStrategy(PokerStrategy):
             }
 
 
+def _preflop_equity_formula(high: int, low: int, suited: bool) -> float:
+    """Approximate preflop equity of a starting hand (suitedness is not priced yet)"""
+    if high == low:
+        # Pocket pairs: stronger pairs = higher equity
+        equity = 0.5 + (high / 14.0) * 0.3
+    elif high >= 12:  # Ace or King high
+        equity = 0.45 + (high / 14.0) * 0.2
+    elif high >= 10:  # Face cards
+        equity = 0.35 + (high / 14.0) * 0.15
+    else:
+        equity = 0.25 + (high / 14.0) * 0.1
+    
+    return min(equity, 0.95)
+
+
+# Preflop equity for all 169 starting hands, keyed by (high rank, low rank, suited)
+_PREFLOP_EQUITY = {
+    (high, low, suited): _preflop_equity_formula(high, low, suited)
+    for high in range(2, 15)
+    for low in range(2, high + 1)
+    for suited in ((False,) if high == low else (False, True))
+}
+
+
 class EquityCalculatorStrategy(PokerStrategy):
     """Equity Calculator Agent - calculates hand equity vs estimated opponent range"""
     
+    # Postflop equity by hand category. High card is low so most hands fold; a pair
+    # is bottom pair/underpair unless it is top pair; trips and two pair are kept
+    # lower because they can be vulnerable.
+    _CATEGORY_EQUITY = (0.15, 0.25, 0.60, 0.70, 0.80, 0.85, 0.90, 0.95, 0.99)
+    
     def _calculate_preflop_equity(self, player_cards: list) -> float:
         """Calculate preflop equity using lookup table approximation"""
         if not player_cards or len(player_cards) < 2:
             return 0.0
         
-        ranks = []
-        for card_str in player_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        # Simplified preflop equity
-        is_pair = len(set(ranks)) == 1
-        max_rank = max(ranks)
-        min_rank = min(ranks)
-        
-        if is_pair:
-            # Pocket pairs: stronger pairs = higher equity
-            equity = 0.5 + (max_rank / 14.0) * 0.3
-        elif max_rank >= 12:  # Ace or King high
-            equity = 0.45 + (max_rank / 14.0) * 0.2
-        elif max_rank >= 10:  # Face cards
-            equity = 0.35 + (max_rank / 14.0) * 0.15
-        else:
-            equity = 0.25 + (max_rank / 14.0) * 0.1
-        
-        return min(equity, 0.95)
+        first, second = player_cards[0], player_cards[1]
+        rank1 = _RANK_LUT[ord(first[0])]
+        rank2 = _RANK_LUT[ord(second[0])]
+        if rank1 < rank2:
+            rank1, rank2 = rank2, rank1
+        return _PREFLOP_EQUITY[(rank1, rank2, rank1 != rank2 and first[-1] == second[-1])]
     
     def _calculate_postflop_equity(self, player_cards: list, community_cards: list) -> float:
         """Calculate postflop equity"""
-        all_cards = player_cards + community_cards
-        if len(all_cards) < 5:
+        if len(player_cards) + len(community_cards) < 5:
             return self._calculate_preflop_equity(player_cards)
         
-        from collections import Counter
-        ranks = []
-        for card_str in all_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        
-        equity = 0.0
-        if counts[0] >= 4:
-            equity = 0.95
-        elif counts[0] >= 3 and counts[1] >= 2:
-            equity = 0.90
-        elif counts[0] >= 3:
-            equity = 0.70  # Lower - trips aren't always strong
-        elif counts[0] >= 2 and counts[1] >= 2:
-            equity = 0.60  # Lower - two pair can be vulnerable
-        elif counts[0] >= 2:
+        category, ranks = _classify_cards(chain(player_cards, community_cards))
+        equity = self._CATEGORY_EQUITY[category]
+        if category == ONE_PAIR:
             # Pair - check if it's top pair or bottom pair
-            pair_rank = max([r for r, c in rank_counts.items() if c >= 2])
-            board_ranks = [r for card_str in community_cards for r in ([14 if card_str[0]=='A' else 13 if card_str[0]=='K' else 12 if card_str[0]=='Q' else 11 if card_str[0]=='J' else int(card_str[0])])]
-            if board_ranks and pair_rank >= max(board_ranks):
+            counts = [0] * 15
+            pair_rank = 0
+            for rank in ranks:
+                counts[rank] += 1
+                if counts[rank] == 2:
+                    pair_rank = rank  # Exactly one rank repeats in a one-pair hand
+            board_high = 0
+            for card_str in community_cards:
+                rank = _RANK_LUT[ord(card_str[0])]
+                if rank > board_high:
+                    board_high = rank
+            if board_high and pair_rank >= board_high:
                 equity = 0.45  # Top pair
-            else:
-                equity = 0.25  # Bottom pair or underpair
-        else:
-            equity = 0.15  # Much lower for high card - most hands should fold
         
         return equity
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        community_cards = game_data.get("community_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
-        round_name = game_data.get("game_state", {}).get("round", "preflop")
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        community_cards = g("community_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
+        round_name = (g("game_state") or _EMPTY_DICT).get("round", "preflop")
         
         # Calculate equity
         if round_name == "preflop":
@@ -842,7 +838,7 @@ class EquityCalculatorStrategy(PokerStrategy):
         pot_odds = current_bet / (pot_size + current_bet) if (pot_size + current_bet) > 0 else 0
         
         # Decision based on equity vs pot odds - be more conservative
-        amount_to_call = current_bet - game_data.get("your_current_bet", 0)
+        amount_to_call = current_bet - g("your_current_bet", 0)
         
         if equity < pot_odds * 1.1:  # Need equity to be better than pot odds (more conservative)
             return {
@@ -852,9 +848,9 @@ class EquityCalculatorStrategy(PokerStrategy):
                 "reasoning": f"Equity ({equity:.1%}) < Pot Odds ({pot_odds:.1%}), folding"
             }
         elif equity > pot_odds * 1.5 and equity > 0.5:  # Good equity, raise for value
-            raise_amount = int(current_bet * 2) if current_bet > 0 else 100
+            raise_amount = current_bet * 2 if current_bet > 0 else 100
             max_affordable = player_chips + amount_to_call
-            raise_to = min(raise_amount + game_data.get("your_current_bet", 0), max_affordable)
+            raise_to = min(raise_amount + g("your_current_bet", 0), max_affordable)
             return {
                 "action": "raise",
                 "amount": raise_to,
@@ -870,9 +866,22 @@ class EquityCalculatorStrategy(PokerStrategy):
             }
 
 
-class AdaptiveHeuristicStrategy(PokerStrategy):
+_ADAPTIVE_FOLD_SHORT_STACK = {"action": "fold", "amount": 0, "confidence": 0.8, "reasoning": "Weak hand, preserving short stack"}
+_ADAPTIVE_FOLD_WEAK = {"action": "fold", "amount": 0, "confidence": 0.85, "reasoning": "Weak hand, folding"}
+_ADAPTIVE_FOLD_SHORT_STACK_MODERATE = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Short stack, folding moderate hand"}
+_ADAPTIVE_FOLD_MODERATE = {"action": "fold", "amount": 0, "confidence": 0.7, "reasoning": "Moderate hand, bet too expensive"}
+
+
+class AdaptiveHeuristicStrategy(_HandStrengthMixin, PokerStrategy):
     """Adaptive Heuristic Agent - adjusts strategy based on opponent patterns and stack size"""
     
+    # Adjustment factor by stack tier: short (< 0.5 of starting chips), normal, big (> 1.5).
+    # Short stacks get more aggressive, big stacks more conservative.
+    _STACK_ADJUSTMENT = (1.5, 1.0, 0.8)
+    # Strong-hand sizing per tier in integers: raise to current_bet * num // den
+    # (2x the adjustment factor), or open for 100x the factor
+    _STACK_RAISE = ((3, 1, 150), (2, 1, 100), (8, 5, 80))
+    
     def __init__(self):
         self.opponent_aggression = 0.5  # Track opponent aggression
         self.opponent_fold_rate = 0.5   # Track opponent fold rate
@@ -880,60 +889,25 @@ class AdaptiveHeuristicStrategy(PokerStrategy):
     
     def _evaluate_hand_strength(self, player_cards: list, community_cards: list) -> float:
         """Evaluate hand strength"""
-        all_cards = player_cards + community_cards
         if not player_cards:
             return 0.0
-        
-        from collections import Counter
-        ranks = []
-        for card_str in all_cards:
-            rank_char = card_str[0]
-            if rank_char == 'A':
-                ranks.append(14)
-            elif rank_char == 'K':
-                ranks.append(13)
-            elif rank_char == 'Q':
-                ranks.append(12)
-            elif rank_char == 'J':
-                ranks.append(11)
-            else:
-                ranks.append(int(rank_char))
-        
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        
-        strength = 0.0
-        if counts[0] >= 2:
-            strength = 0.4
-        if counts[0] >= 3:
-            strength = 0.7
-        if counts[0] >= 4:
-            strength = 0.95
-        if len(counts) >= 2 and counts[0] >= 2 and counts[1] >= 2:
-            strength = 0.6
-        if counts[0] >= 3 and counts[1] >= 2:
-            strength = 0.9
-        
-        return min(strength, 1.0)
+        return self._score_hand(player_cards, community_cards)
     
     def make_decision(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
-        player_cards = game_data.get("player_cards", [])
-        community_cards = game_data.get("community_cards", [])
-        current_bet = game_data.get("current_bet", 0)
-        player_chips = game_data.get("player_chips", 1000)
-        pot_size = game_data.get("pot_size", 0)
-        starting_chips = game_data.get("starting_chips", 1000)
+        g = game_data.get
+        player_cards = g("player_cards", [])
+        community_cards = g("community_cards", [])
+        current_bet = g("current_bet", 0)
+        player_chips = g("player_chips", 1000)
+        pot_size = g("pot_size", 0)
+        starting_chips = g("starting_chips", 1000)
         
         # Adjust strategy based on stack size
         stack_ratio = player_chips / starting_chips if starting_chips > 0 else 1.0
         
-        # If short-stacked, become more aggressive
-        if stack_ratio < 0.5:
-            self.adjustment_factor = 1.5  # More aggressive
-        elif stack_ratio > 1.5:
-            self.adjustment_factor = 0.8  # More conservative with big stack
-        else:
-            self.adjustment_factor = 1.0
+        # Tier index from the two comparisons (bools add as ints), then one table lookup
+        stack_tier = (stack_ratio >= 0.5) + (stack_ratio > 1.5)
+        self.adjustment_factor = self._STACK_ADJUSTMENT[stack_tier]
         
         hand_strength = self._evaluate_hand_strength(player_cards, community_cards)
         
@@ -941,37 +915,28 @@ class AdaptiveHeuristicStrategy(PokerStrategy):
         pot_ratio = pot_size / player_chips if player_chips > 0 else 0
         
         # Decision logic with adaptations - be more conservative
-        amount_to_call = current_bet - game_data.get("your_current_bet", 0)
+        amount_to_call = current_bet - g("your_current_bet", 0)
+        # Call amount capped at the stack, computed once for every calling branch
+        affordable_call = amount_to_call if amount_to_call < player_chips else player_chips
         
         if hand_strength < 0.4:  # More conservative threshold
             # Weak hand - fold most of the time
             pot_odds = amount_to_call / (pot_size + amount_to_call) if (pot_size + amount_to_call) > 0 else 0
             if pot_ratio > 0.3 and stack_ratio < 0.7:  # Big pot, short stack
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "confidence": 0.8,
-                    "reasoning": "Weak hand, preserving short stack"
-                }
+                return _ADAPTIVE_FOLD_SHORT_STACK
             elif pot_odds < 0.1 and amount_to_call < player_chips * 0.05:  # Very cheap
                 return {
                     "action": "call",
-                    "amount": min(amount_to_call, player_chips),
+                    "amount": affordable_call,
                     "confidence": 0.5,
                     "reasoning": "Weak hand but very cheap call"
                 }
             else:
-                return {
-                    "action": "fold",
-                    "amount": 0,
-                    "confidence": 0.85,
-                    "reasoning": "Weak hand, folding"
-                }
+                return _ADAPTIVE_FOLD_WEAK
         elif hand_strength < 0.65:  # More conservative threshold
             # Moderate hand
             if stack_ratio < 0.5:  # Short stack - push or fold
                 if hand_strength > 0.5:  # Need stronger hand to push
-                    max_affordable = player_chips + amount_to_call
                     return {
                         "action": "all_in",
                         "amount": player_chips,
@@ -979,12 +944,7 @@ class AdaptiveHeuristicStrategy(PokerStrategy):
                         "reasoning": "Short stack, pushing with decent hand"
                     }
                 else:
-                    return {
-                        "action": "fold",
-                        "amount": 0,
-                        "confidence": 0.7,
-                        "reasoning": "Short stack, folding moderate hand"
-                    }
+                    return _ADAPTIVE_FOLD_SHORT_STACK_MODERATE
             else:
                 # Facing a bet - be more conservative
                 if current_bet > 0:
@@ -992,22 +952,19 @@ class AdaptiveHeuristicStrategy(PokerStrategy):
                     if pot_odds < 0.2:
                         return {
                             "action": "call",
-                            "amount": min(amount_to_call, player_chips),
+                            "amount": affordable_call,
                             "confidence": 0.65,
                             "reasoning": "Moderate hand, calling with good pot odds"
                         }
                     else:
-                        return {
-                            "action": "fold",
-                            "amount": 0,
-                            "confidence": 0.7,
-                            "reasoning": "Moderate hand, bet too expensive"
-                        }
+                        return _ADAPTIVE_FOLD_MODERATE
                 else:
                     # No bet - can value bet
-                    raise_amount = int(current_bet * 1.5) if current_bet > 0 else 60
+                    raise_amount = current_bet * 3 // 2 if current_bet > 0 else 60
+                    raise_to = raise_amount + g("your_current_bet", 0)
                     max_affordable = player_chips + amount_to_call
-                    raise_to = min(raise_amount + game_data.get("your_current_bet", 0), max_affordable)
+                    if raise_to > max_affordable:
+                        raise_to = max_affordable
                     return {
                         "action": "raise",
                         "amount": raise_to,
@@ -1015,10 +972,11 @@ class AdaptiveHeuristicStrategy(PokerStrategy):
                         "reasoning": "Moderate hand, value betting"
                     }
         else:  # Strong hand
-            raise_amount = int(current_bet * (2 * self.adjustment_factor)) if current_bet > 0 else int(100 * self.adjustment_factor)
+            raise_num, raise_den, open_amount = self._STACK_RAISE[stack_tier]
+            raise_amount = current_bet * raise_num // raise_den if current_bet > 0 else open_amount
             return {
                 "action": "raise",
-                "amount": min(raise_amount, player_chips),
+                "amount": raise_amount if raise_amount < player_chips else player_chips,
                 "confidence": 0.9,
                 "reasoning": f"Strong hand, raising (stack ratio: {stack_ratio:.2f})"
             }
@@ -1037,10 +995,17 @@ STRATEGY_MAP = {
     "openai": None  # OpenAI uses LLM, handled separately
 }
 
+# One shared instance per requested agent type (strategies keep no per-game state)
+_STRATEGY_CACHE: Dict[str, Optional[PokerStrategy]] = {}
+
 def get_strategy(agent_type: str) -> Optional[PokerStrategy]:
     """Get strategy instance by type"""
+    try:
+        return _STRATEGY_CACHE[agent_type]
+    except KeyError:
+        pass
     strategy_class = STRATEGY_MAP.get(agent_type.lower())
-    if strategy_class:
-        return strategy_class()
-    return None
+    strategy = strategy_class() if strategy_class else None
+    _STRATEGY_CACHE[agent_type] = strategy
+    return strategy
 